@@ -11,21 +11,22 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog
 from PIL import Image
+import numpy as np
 import pandas as pd
+import csv
+import importlib.util
 import os
+import queue
+import subprocess
 import sys
 import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import lru_cache
 
+# Engine modules are imported lazily (see _warm_engine) so the window
+# appears before the regex tables and training data are built.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from engine.parser_core import (
-    pipeline_mfg_pn, run_qa, parse_single_row,
-)
-from engine.column_mapper import (
-    map_columns, suggest_columns,
-    score_column_for_parsing, detect_supplier_column,
-)
-from engine.training import load_training_data
-from engine import history_db
 
 # ═══════════════════════════════════════════════════════════════
 #  THEME & BRANDING
@@ -51,10 +52,223 @@ BRAND = {
     'font_mono':     'Consolas',
 }
 
+# Shared font tuples, built once instead of per widget
+_FONT_HEADER = (BRAND['font_family'], 16, 'bold')
+_FONT_BODY = (BRAND['font_family'], 12)
+_FONT_MONO = (BRAND['font_mono'], 11)
+_FONT_MONO_S = (BRAND['font_mono'], 9)
+
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
 
+# ═══════════════════════════════════════════════════════════════
+#  ASSETS
+# ═══════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=1)
+def _load_logo():
+    """Header logo resized to 120px wide, or None if the asset is missing.
+
+    Returns the PIL image rather than a CTkImage — the latter is bound to a
+    Tk interpreter, the decoded/resampled pixels are not.
+    """
+    logo_path = os.path.join(os.path.dirname(__file__), 'assets', 'wesco_logo.png')
+    if not os.path.exists(logo_path):
+        return None
+    with Image.open(logo_path) as img:
+        aspect = img.height / img.width
+        w, h = 120, int(120 * aspect)
+        return img.resize((w, h), Image.Resampling.LANCZOS)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  FILE READING
+# ═══════════════════════════════════════════════════════════════
+
+def _read_input_file(path: str, nrows: int = None) -> pd.DataFrame:
+    """Read a CSV/Excel file using the fastest available native reader.
+
+    Excel goes through calamine (Rust) and falls back to openpyxl when the
+    optional package is not installed. CSV stays on pandas' C engine: unlike
+    the PyArrow reader it renames blank and duplicate headers ('Unnamed: N',
+    'X.1') and supports nrows, so the preview slice and the full read always
+    agree on column names. NumPy-backed dtypes are kept on purpose — the
+    engine's blank checks rely on missing cells stringifying to 'nan'.
+    """
+    if path.lower().endswith('.csv'):
+        return pd.read_csv(path, nrows=nrows)
+    try:
+        return pd.read_excel(path, engine='calamine', nrows=nrows)
+    except ImportError:
+        pass                                    # python-calamine not installed
+    except ValueError as e:
+        # pandas < 2.2 has no calamine engine; anything else is a real read
+        # error (corrupt workbook, bad sheet) and goes back to the caller
+        if not str(e).startswith('Unknown engine'):
+            raise
+    return pd.read_excel(path, engine='openpyxl', nrows=nrows)
+
+
+# Rows read for the first paint; the full file is swapped in behind it
+_PREVIEW_ROWS = 200
+
+_HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+
+def _streams_preview(path: str) -> bool:
+    """Whether reading path with nrows stops early instead of parsing it all.
+
+    True for CSV and for the openpyxl fallback. calamine loads the whole
+    sheet before nrows trims it, so a preview slice of an Excel file would
+    only mean parsing it twice.
+    """
+    return path.lower().endswith('.csv') or not _HAS_CALAMINE
+
+
+def _file_key(path: str) -> str:
+    """Identity of the current version of path (mtime + size + location)."""
+    st = os.stat(path)
+    return f"{st.st_mtime_ns}:{st.st_size}:{os.path.abspath(path)}"
+
+
+# Fully processed loads kept in-process (never written to disk), keyed by
+# _file_key: key -> (df, scored_cols, supplier_col, column_mapping, empty_rows).
+# FIFO-bounded.
+_LOADED_MEMO: dict = {}
+_LOADED_MEMO_MAX = 2
+
+
+def _optimize_dtypes(df: pd.DataFrame, keep_object: tuple = ()) -> pd.DataFrame:
+    """Shrink a freshly loaded DataFrame in place and return it.
+
+    Integer columns are downcast to the smallest lossless width and
+    low-cardinality text columns (unique ratio < 0.5) become categoricals.
+    Floats are left alone — float32 would alter exported values. Columns in
+    keep_object stay plain object because the pipeline writes into them.
+    """
+    n = max(len(df), 1)
+    # Walk columns by position so duplicate labels can't select a sub-frame
+    for i, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_integer_dtype(dtype):
+            df.isetitem(i, pd.to_numeric(df.iloc[:, i], downcast='integer'))
+        elif (dtype == object or isinstance(dtype, pd.StringDtype)) \
+                and df.columns[i] not in keep_object:
+            col = df.iloc[:, i]
+            if col.nunique(dropna=False) / n < 0.5:
+                df.isetitem(i, col.astype('category'))
+    return df
+
+
+def _count_empty_rows(df: pd.DataFrame) -> int:
+    """Number of rows where every cell is missing.
+
+    ANDs the per-column null masks and stops as soon as no candidate row is
+    left — usually after the first column or two — instead of building a
+    full-frame boolean matrix.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for col in range(df.shape[1]):
+        mask &= df.iloc[:, col].isna().to_numpy()
+        if not mask.any():
+            return 0
+    return int(mask.sum())
+
+
+# ═══════════════════════════════════════════════════════════════
+#  FILE WRITING
+# ═══════════════════════════════════════════════════════════════
+
+_WRITE_BUFFER_SIZE = 1 << 20   # 1 MiB
+
+
+@contextmanager
+def _atomic_output(path: str):
+    """Yield a temp path that replaces path only once it has been fully written."""
+    tmp = path + '.part'
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _write_csv_atomic(df: pd.DataFrame, path: str):
+    """Write df to path via a temp file, so a crash never leaves half a CSV."""
+    with _atomic_output(path) as tmp:
+        df.to_csv(tmp, index=False, encoding='utf-8-sig')
+
+
+def _write_records_atomic(records: list, path: str):
+    """Write a list of flat dicts as CSV without building a DataFrame first.
+
+    Same layout as pd.DataFrame(records).to_csv(index=False): columns in
+    first-seen key order, missing/None/NaN values written as empty cells.
+    """
+    fields = list(dict.fromkeys(k for r in records for k in r))
+    # A large buffer turns the per-row writes into a handful of syscalls
+    with _atomic_output(path) as tmp, \
+            open(tmp, 'w', newline='', encoding='utf-8-sig',
+                 buffering=_WRITE_BUFFER_SIZE) as f:
+        w = csv.DictWriter(f, fieldnames=fields, lineterminator=os.linesep)
+        w.writeheader()
+        w.writerows(
+            {k: v for k, v in r.items() if v is not None and v == v}
+            for r in records
+        )
+
+
+# ═══════════════════════════════════════════════════════════════
+#  BACKGROUND WORK
+# ═══════════════════════════════════════════════════════════════
+
+class _DaemonPool:
+    """Fixed set of daemon worker threads fed from one queue.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so closing the
+    window mid-parse would leave a headless process running until the job
+    finished. Daemon workers die with the process instead, like the
+    per-job daemon threads this replaced.
+    """
+
+    def __init__(self, workers: int, name: str):
+        self._tasks = queue.SimpleQueue()
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f'{name}_{i}', daemon=True).start()
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self):
+        """Drop queued jobs; a job already running is abandoned at exit."""
+        while True:
+            try:
+                item = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        self._tasks.put(None)
+
+    def _work(self):
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                self._tasks.put(None)  # wake the next worker so it exits too
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  MAIN APPLICATION
 # ═══════════════════════════════════════════════════════════════
@@ -75,6 +289,8 @@ class WescoMROParser(ctk.CTk):
         self.df_output: pd.DataFrame = None
         self.job_result = None
         self.is_processing = False
+        self.is_loading = False
+        self._partial_load = False           # df_input is still the preview slice
         self.column_mapping: dict = None
         self.training_data: dict = None
 
@@ -82,15 +298,47 @@ class WescoMROParser(ctk.CTk):
         self.source_col_vars: dict = {}      # {col_name: tk.BooleanVar}
         self.supplier_col: str = None        # auto-detected supplier column
         self._scored_cols: dict = {}         # {col_name: score}
-
-        # Load training data
-        training_path = os.path.join(os.path.dirname(__file__), 'training_data.json')
-        self.training_data = load_training_data(training_path)
+        self._empty_rows = 0                 # all-blank rows in df_input (counted on the worker)
+        self._preview_job = None             # pending after() id for preview refresh
+        self._preview_cards: list = []       # pooled preview card widgets
+        self._preview_placeholder = None     # "select a column" hint label
+        self._preview_sample_src = None      # df the cached preview sample came from
+        self._preview_sample: tuple = None   # (row_indices, sample_df)
+        self._last_preview_df = None         # df the visible preview was rendered from
+        self._last_selected: tuple = None    # source columns it was rendered with
+        self._col_panel_gen = 0              # bumps to cancel stale chunked row builds
+        self._col_panel_specs: tuple = None  # row specs the built checkbox rows show
+        self._col_panel_vars: dict = {}      # BooleanVars bound to those rows
+
+        # Persistent worker pool for background work (pipeline runs) —
+        # avoids spawning a fresh thread per operation
+        self._pool = _DaemonPool(workers=2, name='parser')
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
 
         # Build UI
         self._build_header()
         self._build_scroll_area()
 
+        # Import the engine + load training data (and the Excel reader) in the background
+        self._engine_ready = self._pool.submit(self._warm_engine)
+        self._pool.submit(self._warm_excel_reader)
+
+    def _warm_engine(self):
+        """Import engine modules and load training data (runs on the pool)."""
+        from engine import parser_core, column_mapper, history_db  # noqa: F401
+        from engine.training import load_training_data
+
+        training_path = os.path.join(os.path.dirname(__file__), 'training_data.json')
+        self.training_data = load_training_data(training_path)
+
+    @staticmethod
+    def _warm_excel_reader():
+        """Import the Excel backend ahead of the first drop (runs on the pool)."""
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            import openpyxl  # noqa: F401
+
     # ───────────────────────────────────────────────────────
     #  HEADER (fixed, above scroll)
     # ───────────────────────────────────────────────────────
@@ -105,12 +353,9 @@ class WescoMROParser(ctk.CTk):
 
         logo_loaded = False
         try:
-            logo_path = os.path.join(os.path.dirname(__file__), 'assets', 'wesco_logo.png')
-            if os.path.exists(logo_path):
-                img = Image.open(logo_path)
-                aspect = img.height / img.width
-                w, h = 120, int(120 * aspect)
-                img = img.resize((w, h), Image.Resampling.LANCZOS)
+            img = _load_logo()
+            if img is not None:
+                w, h = img.size
                 logo_ctk = ctk.CTkImage(light_image=img, dark_image=img, size=(w, h))
                 lbl = ctk.CTkLabel(inner, image=logo_ctk, text='', fg_color='transparent')
                 lbl.image = logo_ctk
@@ -128,7 +373,7 @@ class WescoMROParser(ctk.CTk):
                          text_color=BRAND['text_primary']).pack(side='left', padx=(0, 8))
 
         ctk.CTkLabel(inner, text="MRO Data Parser",
-                     font=(BRAND['font_family'], 12),
+                     font=_FONT_BODY,
                      text_color=BRAND['text_muted']).pack(side='left')
 
         ctk.CTkLabel(inner, text="v5.0",
@@ -199,10 +444,9 @@ class WescoMROParser(ctk.CTk):
             widget.bind('<Button-1>', lambda e: self._browse_file())
 
         # Hover effect
-        self._dropzone.bind('<Enter>', lambda e: self._dropzone.configure(
-            border_color=BRAND['accent']))
-        self._dropzone.bind('<Leave>', lambda e: self._dropzone.configure(
-            border_color=BRAND['border']))
+        self._dropzone_border = BRAND['border']
+        self._dropzone.bind('<Enter>', lambda e: self._set_dropzone_border(BRAND['accent']))
+        self._dropzone.bind('<Leave>', lambda e: self._set_dropzone_border(BRAND['border']))
 
         # Drag-and-drop (optional — graceful fallback if not available)
         try:
@@ -211,6 +455,13 @@ class WescoMROParser(ctk.CTk):
         except Exception:
             pass
 
+    def _set_dropzone_border(self, color: str):
+        """Restyle the drop zone border only when the color actually changes."""
+        if color == self._dropzone_border:
+            return
+        self._dropzone_border = color
+        self._dropzone.configure(border_color=color)
+
     # ───────────────────────────────────────────────────────
     #  FILE INFO BAR  (shown after load)
     # ───────────────────────────────────────────────────────
@@ -288,16 +539,12 @@ class WescoMROParser(ctk.CTk):
                      text_color=BRAND['text_muted']).pack(side='left', padx=(6, 16))
 
         self._sup_label = ctk.CTkLabel(self._sup_frame, text="",
-                                        font=(BRAND['font_mono'], 11),
+                                        font=_FONT_MONO,
                                         text_color=BRAND['accent'])
         self._sup_label.pack(side='left')
 
     def _populate_column_panel(self):
         """Rebuild checkbox list based on scored columns."""
-        for w in self._col_list_frame.winfo_children():
-            w.destroy()
-        self.source_col_vars = {}
-
         cols = list(self.df_input.columns)
         visible_cols = [
             (col, self._scored_cols.get(col, 0))
@@ -309,17 +556,15 @@ class WescoMROParser(ctk.CTk):
             # Fallback: show all columns if scoring returned nothing
             visible_cols = [(col, 0) for col in cols]
 
+        # Position lookup built once (first occurrence wins, like list.index)
+        col_to_idx = {c: i for i, c in reversed(list(enumerate(cols)))}
+
+        specs = []
         for col, score in visible_cols:
-            idx = cols.index(col)
+            idx = col_to_idx[col]
             letter = chr(ord('A') + idx) if idx < 26 else f"Col{idx + 1}"
             auto_check = score >= 40
 
-            row = ctk.CTkFrame(self._col_list_frame, fg_color='transparent')
-            row.pack(fill='x', pady=2)
-
-            var = tk.BooleanVar(value=auto_check)
-            self.source_col_vars[col] = var
-
             # Build display name — for Unnamed columns show sample value
             display_name = col
             if 'unnamed' in col.lower():
@@ -328,11 +573,54 @@ class WescoMROParser(ctk.CTk):
                     preview_val = sample_vals[0][:40]
                     display_name = f"{col}  (e.g. '{preview_val}')"
 
+            specs.append((col, letter, auto_check, display_name))
+        specs = tuple(specs)
+
+        if specs == self._col_panel_specs:
+            # Same columns as the panel already shows (e.g. re-parsing next
+            # month's export) — keep the widgets, just reset the selections
+            for col, _, auto_check, _ in specs:
+                self._col_panel_vars[col].set(auto_check)
+        else:
+            for w in self._col_list_frame.winfo_children():
+                w.destroy()
+            self._col_panel_specs = None
+
+            # Selection state is created up front so preview/parse see every column
+            # even while the checkbox widgets are still being streamed in below
+            self._col_panel_vars = {
+                col: tk.BooleanVar(value=auto_check)
+                for col, _, auto_check, _ in specs
+            }
+            self._col_panel_gen += 1
+            self._add_column_rows(specs, 0, self._col_panel_gen)
+
+        self.source_col_vars = self._col_panel_vars
+
+        # Supplier hint
+        if self.supplier_col:
+            self._sup_label.configure(
+                text=f"Auto-detected: {self.supplier_col}  ✓"
+            )
+        else:
+            self._sup_label.configure(text="None detected")
+
+    def _add_column_rows(self, specs: tuple, start: int, gen: int, chunk: int = 25):
+        """Create checkbox rows in chunks, yielding to the event loop between them."""
+        if gen != self._col_panel_gen:
+            return  # superseded by a newer file load / reset
+
+        cb_font = _FONT_BODY
+        tag_font = _FONT_MONO_S
+        rows = []
+        for col, letter, auto_check, display_name in specs[start:start + chunk]:
+            row = ctk.CTkFrame(self._col_list_frame, fg_color='transparent')
+
             cb = ctk.CTkCheckBox(
                 row,
                 text=f"{letter}:  {display_name}",
-                variable=var,
-                font=(BRAND['font_family'], 12),
+                variable=self._col_panel_vars[col],
+                font=cb_font,
                 text_color=BRAND['accent'] if auto_check else BRAND['text_primary'],
                 fg_color=BRAND['accent'],
                 hover_color=BRAND['accent_hover'],
@@ -342,16 +630,18 @@ class WescoMROParser(ctk.CTk):
 
             if auto_check:
                 ctk.CTkLabel(row, text="← auto-selected",
-                             font=(BRAND['font_mono'], 9),
+                             font=tag_font,
                              text_color=BRAND['accent_dim']).pack(side='right', padx=8)
+            rows.append(row)
 
-        # Supplier hint
-        if self.supplier_col:
-            self._sup_label.configure(
-                text=f"Auto-detected: {self.supplier_col}  ✓"
-            )
+        # Attach the finished rows together so the chunk costs one layout pass
+        for row in rows:
+            row.pack(fill='x', pady=2)
+
+        if start + chunk < len(specs):
+            self.after_idle(self._add_column_rows, specs, start + chunk, gen, chunk)
         else:
-            self._sup_label.configure(text="None detected")
+            self._col_panel_specs = specs  # fully built — eligible for reuse
 
     # ───────────────────────────────────────────────────────
     #  STEP 2B: SMART PREVIEW PANEL  (shown after load)
@@ -377,37 +667,70 @@ class WescoMROParser(ctk.CTk):
 
     def _refresh_preview(self):
         """Parse 3-5 sample rows and update the preview panel."""
-        for w in self._preview_rows_frame.winfo_children():
-            w.destroy()
+        selected = tuple(c for c, v in self.source_col_vars.items() if v.get())
+        if (self.df_input is not None and self.df_input is self._last_preview_df
+                and selected == self._last_selected):
+            return  # e.g. a box ticked and unticked within one debounce window
+        self._last_preview_df, self._last_selected = self.df_input, selected
+
+        # Rebuild while detached so all cards land in a single geometry pass
+        self._preview_rows_frame.pack_forget()
+        try:
+            self._render_preview_rows()
+        finally:
+            self._preview_rows_frame.pack(fill='x', padx=12, pady=(0, 14))
 
+    def _render_preview_rows(self):
+        """Fill pooled preview cards — widgets are created once and reconfigured."""
         if self.df_input is None:
+            self._show_preview_cards(0)
             return
 
         selected_cols = [c for c, v in self.source_col_vars.items() if v.get()]
         if not selected_cols:
-            ctk.CTkLabel(self._preview_rows_frame,
-                         text="Select at least one source column above to see a preview.",
-                         font=(BRAND['font_family'], 11),
-                         text_color=BRAND['text_muted']).pack(padx=8, pady=8)
+            self._show_preview_cards(0)
+            if self._preview_placeholder is None:
+                self._preview_placeholder = ctk.CTkLabel(
+                    self._preview_rows_frame,
+                    text="Select at least one source column above to see a preview.",
+                    font=(BRAND['font_family'], 11),
+                    text_color=BRAND['text_muted'])
+            self._preview_placeholder.pack(padx=8, pady=8)
             return
 
-        sample_indices = self._pick_diverse_samples(5)
+        if self._preview_placeholder is not None:
+            self._preview_placeholder.pack_forget()
 
-        for idx in sample_indices:
-            row_data = self.df_input.iloc[idx]
-            source_text = '  |  '.join(
-                str(row_data[c]) for c in selected_cols
-                if c in self.df_input.columns and pd.notna(row_data[c])
-            )
-            supplier_hint = (
-                str(row_data[self.supplier_col])
-                if self.supplier_col and self.supplier_col in self.df_input.columns
-                   and pd.notna(row_data[self.supplier_col])
-                else None
-            )
+        from engine.parser_core import parse_rows_batch
+
+        sample_indices, sample = self._get_preview_sample()
+        self._show_preview_cards(len(sample_indices))
+
+        # Narrow the cached sample to the columns this refresh actually reads
+        sup_col = self.supplier_col if self.supplier_col in sample.columns else None
+        view = sample[list(dict.fromkeys(
+            [c for c in selected_cols if c in sample.columns] + ([sup_col] if sup_col else [])
+        ))]
+
+        # One projection + one null mask for the whole sample instead of
+        # per-cell row_data[c] / pd.notna() lookups
+        text_cols = [c for c in selected_cols if c in view.columns]
+        text_values = view[text_cols].to_numpy(dtype=object)
+        text_mask = view[text_cols].notna().to_numpy(dtype=bool)
+        source_texts = [
+            '  |  '.join(v for v, ok in zip(values, present) if ok)
+            for values, present in zip(text_values, text_mask)
+        ]
+        if sup_col:
+            sup = view[sup_col]
+            supplier_hints = sup.astype(object).where(sup.notna(), None).tolist()
+        else:
+            supplier_hints = [None] * len(source_texts)
 
-            mfg, pn = parse_single_row(source_text, supplier_hint)
+        parsed = parse_rows_batch(source_texts, supplier_hints)
 
+        for card, idx, source_text, (mfg, pn) in zip(
+                self._preview_cards, sample_indices, source_texts, parsed):
             confidence = 'high' if (mfg and pn) else ('partial' if (mfg or pn) else 'none')
             color_map = {
                 'high':    BRAND['success'],
@@ -416,31 +739,61 @@ class WescoMROParser(ctk.CTk):
             }
             color = color_map[confidence]
 
-            card = ctk.CTkFrame(self._preview_rows_frame,
-                                fg_color=BRAND['bg_input'], corner_radius=8)
-            card.pack(fill='x', padx=4, pady=3)
-
-            inner = ctk.CTkFrame(card, fg_color='transparent')
-            inner.pack(fill='x', padx=12, pady=8)
-
             # Source text (truncated)
             src_display = source_text[:90] + ('…' if len(source_text) > 90 else '')
-            ctk.CTkLabel(inner, text=f"Row {idx + 1}:  {src_display}",
-                         font=(BRAND['font_family'], 10),
-                         text_color=BRAND['text_secondary'],
-                         anchor='w', justify='left').pack(fill='x')
+            card['source'].configure(text=f"Row {idx + 1}:  {src_display}")
+            card['mfg'].configure(text=f"MFG: {mfg or '—'}", text_color=color)
+            card['pn'].configure(text=f"   PN: {pn or '—'}", text_color=color)
+
+    def _show_preview_cards(self, n: int):
+        """Ensure the first n pooled preview cards exist and are packed; hide the rest."""
+        while len(self._preview_cards) < n:
+            self._preview_cards.append(self._create_preview_card())
+        for i, card in enumerate(self._preview_cards):
+            if i < n:
+                if not card['frame'].winfo_manager():
+                    card['frame'].pack(fill='x', padx=4, pady=3)
+            else:
+                card['frame'].pack_forget()
+
+    def _create_preview_card(self) -> dict:
+        card = ctk.CTkFrame(self._preview_rows_frame,
+                            fg_color=BRAND['bg_input'], corner_radius=8)
+
+        inner = ctk.CTkFrame(card, fg_color='transparent')
+        inner.pack(fill='x', padx=12, pady=8)
+
+        source = ctk.CTkLabel(inner, text="",
+                              font=(BRAND['font_family'], 10),
+                              text_color=BRAND['text_secondary'],
+                              anchor='w', justify='left')
+        source.pack(fill='x')
+
+        result_line = ctk.CTkFrame(inner, fg_color='transparent')
+        result_line.pack(fill='x', pady=(4, 0))
 
-            result_line = ctk.CTkFrame(inner, fg_color='transparent')
-            result_line.pack(fill='x', pady=(4, 0))
+        mfg = ctk.CTkLabel(result_line, text="",
+                           font=(BRAND['font_mono'], 11, 'bold'))
+        mfg.pack(side='left')
+        pn = ctk.CTkLabel(result_line, text="",
+                          font=_FONT_MONO)
+        pn.pack(side='left')
 
-            ctk.CTkLabel(result_line,
-                         text=f"MFG: {mfg or '—'}",
-                         font=(BRAND['font_mono'], 11, 'bold'),
-                         text_color=color).pack(side='left')
-            ctk.CTkLabel(result_line,
-                         text=f"   PN: {pn or '—'}",
-                         font=(BRAND['font_mono'], 11),
-                         text_color=color).pack(side='left')
+        return {'frame': card, 'source': source, 'mfg': mfg, 'pn': pn}
+
+    def _get_preview_sample(self) -> tuple:
+        """Return (row_indices, sample_df) for the preview, computed once per load.
+
+        The slice is held as pandas' string dtype (Arrow-backed when pyarrow is
+        installed), so cells are stringified once here rather than on every
+        checkbox toggle. Missing cells become pd.NA and are still skipped by
+        the notna() mask in _render_preview_rows.
+        """
+        if self._preview_sample_src is not self.df_input:
+            indices = self._pick_diverse_samples(5)
+            self._preview_sample = (indices, self.df_input.iloc[indices].astype('string'))
+            self._preview_sample_src = self.df_input
+        return self._preview_sample
 
     def _pick_diverse_samples(self, n: int) -> list:
         """Return up to n row indices spread across the dataframe."""
@@ -462,7 +815,7 @@ class WescoMROParser(ctk.CTk):
             self._parse_btn_frame,
             text="▶  PARSE FILE",
             height=52,
-            font=(BRAND['font_family'], 16, 'bold'),
+            font=_FONT_HEADER,
             fg_color=BRAND['accent'],
             hover_color=BRAND['accent_hover'],
             text_color='#FFFFFF',
@@ -497,15 +850,43 @@ class WescoMROParser(ctk.CTk):
         )
         # Packed by _show_results()
 
-        # Metrics row
+        # Metrics row — labels are built once and reconfigured by _show_results()
         self._metrics_frame = ctk.CTkFrame(self._results_panel, fg_color='transparent')
         self._metrics_frame.pack(fill='x', padx=16, pady=(16, 8))
 
+        ctk.CTkLabel(self._metrics_frame, text="✅  COMPLETE",
+                     font=_FONT_HEADER,
+                     text_color=BRAND['success']).pack(anchor='w')
+
+        # All stat lines share one left-justified label
+        self._stats_label = ctk.CTkLabel(self._metrics_frame, text='', font=_FONT_BODY,
+                                         text_color=BRAND['text_primary'],
+                                         justify='left')
+        self._stats_label.pack(anchor='w', pady=1)
+
         # File paths
         self._paths_frame = ctk.CTkFrame(self._results_panel, fg_color=BRAND['bg_input'],
                                           corner_radius=8)
         self._paths_frame.pack(fill='x', padx=16, pady=(0, 12))
 
+        self._paths_inner = ctk.CTkFrame(self._paths_frame, fg_color='transparent')
+        self._paths_inner.pack(fill='x', padx=12, pady=10)
+
+        self._main_name_label = ctk.CTkLabel(self._paths_inner, text='', font=_FONT_MONO,
+                                             text_color=BRAND['accent'])
+        self._main_path_label = ctk.CTkLabel(self._paths_inner, text='', font=_FONT_MONO_S,
+                                             text_color=BRAND['text_muted'])
+        self._qa_name_label = ctk.CTkLabel(self._paths_inner, text='', font=_FONT_MONO,
+                                           text_color=BRAND['warning'])
+        self._qa_path_label = ctk.CTkLabel(self._paths_inner, text='', font=_FONT_MONO_S,
+                                           text_color=BRAND['text_muted'])
+        self._save_failed_label = ctk.CTkLabel(
+            self._paths_inner,
+            text="⚠  Auto-save failed. Use your file manager to save manually.",
+            font=(BRAND['font_family'], 11),
+            text_color=BRAND['warning'],
+        )
+
         # Action buttons
         btn_row = ctk.CTkFrame(self._results_panel, fg_color='transparent')
         btn_row.pack(fill='x', padx=16, pady=(0, 16))
@@ -555,41 +936,156 @@ class WescoMROParser(ctk.CTk):
             self._load_file(path)
 
     def _load_file(self, path: str):
+        if self.is_loading or self.is_processing:
+            return
+        self.is_loading = True
+        self._drop_label.configure(text="Loading…", text_color=BRAND['text_muted'])
+        self._pool.submit(self._read_worker, path)
+
+    def _read_worker(self, path: str):
+        """Read, score, and map the file off the Tk thread.
+
+        CSV files (and Excel without calamine) are read twice: a
+        _PREVIEW_ROWS slice that is posted to the UI straight away, then the
+        full frame, which replaces it. Excel read by calamine is parsed in
+        full either way, so it is read once and posted once. Column scores
+        and the supplier column depend only on the headers and the first 20
+        rows, so a full frame with identical headers reuses the slice's
+        results. A file reloaded unchanged in the same session skips all of
+        this (_LOADED_MEMO).
+        """
         try:
-            self._drop_label.configure(text="Loading…", text_color=BRAND['text_muted'])
-            self.update_idletasks()
-
-            if path.lower().endswith('.csv'):
-                self.df_input = pd.read_csv(path)
+            self._engine_ready.result()
+
+            memo_key = _file_key(path)
+            hit = _LOADED_MEMO.get(memo_key)
+            if hit is not None:
+                # Same file, unchanged since it was last loaded this session
+                self.after(0, self._apply_loaded_df, path, *hit, False)
+                return
+
+            header_scores = None
+            if _streams_preview(path):
+                df = _read_input_file(path, nrows=_PREVIEW_ROWS)
+                df.columns = df.columns.astype(str).str.strip()
+                if len(df) >= _PREVIEW_ROWS:
+                    preview_scores = self._post_loaded_df(path, df, partial=True)[:2]
+                    full = _read_input_file(path)
+                    full.columns = full.columns.astype(str).str.strip()
+                    # Scores describe the preview's headers — only reuse them
+                    # when the full frame has the same ones; otherwise rescore,
+                    # and _apply_loaded_df repopulates the column panel
+                    if full.columns.equals(df.columns):
+                        header_scores = preview_scores
+                    df = full
             else:
-                self.df_input = pd.read_excel(path, engine='openpyxl')
+                # calamine parses the whole sheet whatever nrows says, so
+                # there is no cheap preview: read once and score that frame
+                df = _read_input_file(path)
+                df.columns = df.columns.astype(str).str.strip()
 
-            self.df_input.columns = [str(c).strip() for c in self.df_input.columns]
-            self.current_file = path
+            loaded = self._post_loaded_df(
+                path, df, partial=False, header_scores=header_scores)
 
-            # Score columns and detect supplier
-            self._scored_cols = {
-                col: score_column_for_parsing(col, self.df_input[col].tolist())
-                for col in self.df_input.columns
-            }
-            self.supplier_col = detect_supplier_column(list(self.df_input.columns))
-            self.column_mapping = map_columns(self.df_input, self.training_data)
+            if len(_LOADED_MEMO) >= _LOADED_MEMO_MAX:
+                _LOADED_MEMO.pop(next(iter(_LOADED_MEMO)))
+            _LOADED_MEMO[memo_key] = (df, *loaded)
+
+        except Exception as e:
+            self.after(0, self._on_load_error, str(e))
+
+    def _post_loaded_df(self, path: str, df: pd.DataFrame, partial: bool,
+                        header_scores: tuple = None) -> tuple:
+        """Score/map df on the worker, then hand it to the Tk thread.
+
+        Returns (scored_cols, supplier_col, column_mapping, empty_rows); after
+        a preview slice, the first two can be passed back in as header_scores
+        for the full frame when it has the same headers.
+        """
+        from engine.column_mapper import (
+            map_columns, score_columns_batch, detect_supplier_column,
+        )
+        from engine.parser_core import PIPELINE_WRITE_COLUMNS
 
+        if header_scores is not None:
+            scored_cols, supplier_col = header_scores
+        else:
+            scored_cols = score_columns_batch(df)
+            supplier_col = detect_supplier_column(list(df.columns))
+        column_mapping = map_columns(df, self.training_data)
+        empty_rows = _count_empty_rows(df)  # for the inline warnings
+
+        # Output targets are written cell-by-cell by the pipeline; keep them
+        # object, including flag columns of a previously parsed file
+        _optimize_dtypes(df, keep_object=(
+            column_mapping.get('mfg_output'),
+            column_mapping.get('pn_output'),
+            column_mapping.get('sim_output'),
+            *PIPELINE_WRITE_COLUMNS,
+        ))
+
+        self.after(0, self._apply_loaded_df, path, df, scored_cols,
+                   supplier_col, column_mapping, empty_rows, partial)
+        return scored_cols, supplier_col, column_mapping, empty_rows
+
+    def _apply_loaded_df(self, path: str, df: pd.DataFrame, scored_cols: dict,
+                         supplier_col: str, column_mapping: dict, empty_rows: int,
+                         partial: bool):
+        # Selections only carry over when the full frame kept the preview's
+        # headers; otherwise rebuild the column panel from scratch
+        swapping_in_full = (
+            self._partial_load and not partial
+            and self.df_input is not None and df.columns.equals(self.df_input.columns)
+        )
+        self._partial_load = partial
+        self.is_loading = partial
+        self.df_input = df
+        self.current_file = path
+        self._scored_cols = scored_cols
+        self.supplier_col = supplier_col
+        self.column_mapping = column_mapping
+        self._empty_rows = empty_rows
+
+        if swapping_in_full:
+            self._on_full_frame_loaded(path)
+        else:
             self._on_file_loaded(path)
 
-        except Exception as e:
-            self._drop_label.configure(
-                text=f"Error loading file: {e}",
-                text_color=BRAND['error'],
-            )
+        if partial:
+            self._parse_btn.configure(state='disabled', text="⏳  Loading all rows…")
+        else:
+            self._parse_btn.configure(state='normal', text="▶  PARSE FILE")
+        self._set_load_progress(partial)
+
+    def _set_load_progress(self, active: bool):
+        """Animate the progress bar while the full file loads behind the preview."""
+        if active:
+            self._progress_bar.configure(mode='indeterminate')
+            self._progress_bar.start()
+        elif self._progress_bar.cget('mode') == 'indeterminate':
+            self._progress_bar.stop()
+            self._progress_bar.configure(mode='determinate')
+            self._progress_bar.set(0)
+
+    def _on_load_error(self, error_msg: str):
+        if self._partial_load:
+            # Only the preview slice made it in — drop it and the panels built
+            # from it, so the 200-row slice can never be parsed as the file
+            self._set_load_progress(False)
+            self._reset()
+        self.is_loading = False
+        self._partial_load = False
+        self._drop_label.configure(
+            text=f"Error loading file: {error_msg}",
+            text_color=BRAND['error'],
+        )
 
     def _on_file_loaded(self, path: str):
         filename = os.path.basename(path)
-        n_rows = len(self.df_input)
-        n_cols = len(self.df_input.columns)
 
         # Shrink dropzone and update label
-        self._dropzone.configure(height=60, border_color=BRAND['accent'], border_width=1)
+        self._dropzone.configure(height=60, border_width=1)
+        self._set_dropzone_border(BRAND['accent'])
         self._drop_icon.configure(text="✓", font=(BRAND['font_family'], 16),
                                    text_color=BRAND['accent'])
         self._drop_label.configure(
@@ -597,13 +1093,10 @@ class WescoMROParser(ctk.CTk):
             font=(BRAND['font_family'], 13, 'bold'),
             text_color=BRAND['accent'],
         )
-        self._drop_hint.configure(
-            text=f"{n_rows:,} rows  ·  {n_cols} columns  ·  click to change file",
-        )
 
         # File info bar
         self._file_name_label.configure(text=f"✓  {filename}")
-        self._file_meta_label.configure(text=f"{n_rows:,} rows  ·  {n_cols} columns")
+        self._update_file_meta()
         self._file_info.pack(fill='x', pady=(0, 4))
 
         # Inline warnings
@@ -618,6 +1111,21 @@ class WescoMROParser(ctk.CTk):
         # Refresh preview in background to keep UI snappy
         self.after(50, self._refresh_preview)
 
+    def _on_full_frame_loaded(self, path: str):
+        """Full file replaced the preview slice with the same columns — keep selections."""
+        self._update_file_meta()
+        self._build_inline_warnings()
+        self._refresh_preview()
+
+    def _update_file_meta(self):
+        n_rows = len(self.df_input)
+        n_cols = len(self.df_input.columns)
+        rows_text = f"{n_rows:,}+ rows (loading…)" if self._partial_load else f"{n_rows:,} rows"
+        self._drop_hint.configure(
+            text=f"{rows_text}  ·  {n_cols} columns  ·  click to change file",
+        )
+        self._file_meta_label.configure(text=f"{rows_text}  ·  {n_cols} columns")
+
     def _build_inline_warnings(self):
         """Show inline warnings about file quality issues (replaces buried Data Prep Tips)."""
         for w in self._warnings_area.winfo_children():
@@ -632,9 +1140,8 @@ class WescoMROParser(ctk.CTk):
                 "The engine will use row content to identify data."
             )
 
-        empty_rows = self.df_input.isnull().all(axis=1).sum()
-        if empty_rows > 0:
-            warnings.append(f"⚠  {empty_rows} completely empty rows — these will produce blank output.")
+        if self._empty_rows > 0:
+            warnings.append(f"⚠  {self._empty_rows} completely empty rows — these will produce blank output.")
 
         high_score_cols = [c for c, s in self._scored_cols.items() if s >= 40]
         if not high_score_cols:
@@ -650,21 +1157,30 @@ class WescoMROParser(ctk.CTk):
                          anchor='w', justify='left').pack(anchor='w', pady=2)
 
         if warnings:
-            self._warnings_area.pack(fill='x', pady=(0, 4))
+            self._warnings_area.pack(fill='x', pady=(0, 4), after=self._file_info)
+        else:
+            self._warnings_area.pack_forget()
 
     # ═══════════════════════════════════════════════════════
     #  COLUMN CHANGE → REFRESH PREVIEW
     # ═══════════════════════════════════════════════════════
 
     def _on_column_changed(self):
-        self.after(80, self._refresh_preview)
+        # Debounce: a burst of checkbox clicks collapses into one preview refresh
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(150, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        self._preview_job = None
+        self._refresh_preview()
 
     # ═══════════════════════════════════════════════════════
     #  PARSING
     # ═══════════════════════════════════════════════════════
 
     def _on_parse_clicked(self):
-        if self.df_input is None or self.is_processing:
+        if self.df_input is None or self.is_processing or self.is_loading:
             return
 
         selected_cols = [c for c, v in self.source_col_vars.items() if v.get()]
@@ -682,11 +1198,12 @@ class WescoMROParser(ctk.CTk):
                                       text_color=BRAND['text_muted'])
         self.title(f"Wesco MRO Parser — {os.path.basename(self.current_file)}")
 
-        threading.Thread(target=self._execute_pipeline,
-                         args=(selected_cols,), daemon=True).start()
+        self._pool.submit(self._execute_pipeline, selected_cols)
 
     def _execute_pipeline(self, source_cols: list):
         try:
+            from engine.parser_core import pipeline_mfg_pn, run_qa
+
             self.after(0, lambda: self._progress_bar.set(0.25))
 
             result = pipeline_mfg_pn(
@@ -704,9 +1221,25 @@ class WescoMROParser(ctk.CTk):
 
             self.after(0, lambda: self._progress_bar.set(0.90))
 
-            # Save to history
+            # Export on the worker — serializing a large CSV on the Tk thread froze the UI
+            exported_main, exported_qa = self._auto_export(result, issues)
+
+            self.after(0, self._on_parse_complete, result, issues,
+                       exported_main, exported_qa)
+
+            # History is bookkeeping — record it after the results are posted
+            self._pool.submit(self._save_history,
+                              os.path.basename(self.current_file or 'unknown'),
+                              source_cols, result, len(issues))
+
+        except Exception as e:
+            self.after(0, lambda: self._on_parse_error(str(e)))
+
+    def _save_history(self, filename: str, source_cols: list, result, issues_count: int):
+        try:
+            from engine import history_db
             history_db.save_job(
-                filename=os.path.basename(self.current_file or 'unknown'),
+                filename=filename,
                 instruction='', pipeline='mfg_pn',
                 source_columns=source_cols,
                 target_mfg='MFG', target_pn='PN',
@@ -715,33 +1248,28 @@ class WescoMROParser(ctk.CTk):
                 mfg_filled=result.mfg_filled,
                 pn_filled=result.pn_filled,
                 sim_filled=result.sim_filled,
-                issues_count=len(issues),
+                issues_count=issues_count,
                 output_path='',
             )
-
-            self.df_output = result.df
-            self.job_result = result
-
-            self.after(0, lambda: self._on_parse_complete(result, issues))
-
         except Exception as e:
-            self.after(0, lambda: self._on_parse_error(str(e)))
+            print(f"History save error: {e}")
 
-    def _on_parse_complete(self, result, issues):
-        self._progress_bar.set(1.0)
+    def _on_parse_complete(self, result, issues, exported_main, exported_qa):
         self.is_processing = False
-        self._parse_btn.configure(state='normal', text="▶  PARSE FILE")
-
-        # Auto-export
-        exported_main, exported_qa = self._auto_export(result, issues)
+        # Published here, on the Tk thread, so UI state is only ever written from one thread
+        self.df_output = result.df
+        self.job_result = result
         self._exported_path = exported_main
 
+        self._progress_bar.set(1.0)
+        self._parse_btn.configure(state='normal', text="▶  PARSE FILE")
         self._parse_status.configure(
             text=f"✓ Complete — file saved to {os.path.dirname(exported_main) if exported_main else 'unknown'}",
             text_color=BRAND['success'],
         )
 
         self._show_results(result, issues, exported_main, exported_qa)
+        self.update_idletasks()
 
     def _on_parse_error(self, error_msg: str):
         self._progress_bar.set(0)
@@ -764,23 +1292,23 @@ class WescoMROParser(ctk.CTk):
         if not self.current_file or result is None:
             return None, None
 
-        src_dir = os.path.dirname(self.current_file)
-        base = os.path.splitext(os.path.basename(self.current_file))[0]
+        # One split of the source path; splitext only looks at the final
+        # component, so dots in folder names can't leak into the stem
+        stem = os.path.splitext(os.fspath(self.current_file))[0]
 
-        main_path = os.path.join(src_dir, f"{base}_parsed.csv")
+        main_path = f"{stem}_parsed.csv"
         qa_path = None
 
         try:
-            result.df.to_csv(main_path, index=False, encoding='utf-8-sig')
+            _write_csv_atomic(result.df, main_path)
         except Exception as e:
             print(f"Auto-export error: {e}")
             return None, None
 
         if issues:
             try:
-                qa_path = os.path.join(src_dir, f"{base}_QA.csv")
-                import pandas as pd
-                pd.DataFrame(issues).to_csv(qa_path, index=False, encoding='utf-8-sig')
+                qa_path = f"{stem}_QA.csv"
+                _write_records_atomic(issues, qa_path)
             except Exception:
                 qa_path = None
 
@@ -791,60 +1319,37 @@ class WescoMROParser(ctk.CTk):
     # ═══════════════════════════════════════════════════════
 
     def _show_results(self, result, issues, main_path, qa_path):
-        # Clear old metrics/paths
-        for w in self._metrics_frame.winfo_children():
-            w.destroy()
-        for w in self._paths_frame.winfo_children():
-            w.destroy()
-
-        # ── Completion badge ──
-        ctk.CTkLabel(self._metrics_frame, text="✅  COMPLETE",
-                     font=(BRAND['font_family'], 16, 'bold'),
-                     text_color=BRAND['success']).pack(anchor='w')
+        # Reuse the pooled labels: unpack everything, then reconfigure and
+        # repack only what this run needs (no widget churn per parse)
+        for w in self._paths_inner.pack_slaves():
+            w.pack_forget()
 
         # ── Stats ──
-        stats = [
+        denom = max(result.total_rows, 1)
+        stats = (
             f"{result.total_rows:,} rows processed",
-            f"MFG filled: {result.mfg_filled:,} ({result.mfg_filled / max(result.total_rows, 1):.0%})",
-            f"PN filled:  {result.pn_filled:,} ({result.pn_filled / max(result.total_rows, 1):.0%})",
-        ]
-        if issues:
-            stats.append(f"Issues flagged: {len(issues):,}")
+            f"MFG filled: {result.mfg_filled:,} ({result.mfg_filled / denom:.0%})",
+            f"PN filled:  {result.pn_filled:,} ({result.pn_filled / denom:.0%})",
+            *((f"Issues flagged: {len(issues):,}",) if issues else ()),
+        )
 
-        for stat in stats:
-            ctk.CTkLabel(self._metrics_frame, text=stat,
-                         font=(BRAND['font_family'], 12),
-                         text_color=BRAND['text_primary']).pack(anchor='w', pady=1)
+        self._stats_label.configure(text='\n'.join(stats))
 
         # ── File paths ──
-        paths_inner = ctk.CTkFrame(self._paths_frame, fg_color='transparent')
-        paths_inner.pack(fill='x', padx=12, pady=10)
-
         if main_path:
-            ctk.CTkLabel(paths_inner,
-                         text=f"📄  {os.path.basename(main_path)}",
-                         font=(BRAND['font_mono'], 11),
-                         text_color=BRAND['accent']).pack(anchor='w')
-            ctk.CTkLabel(paths_inner,
-                         text=f"   {main_path}",
-                         font=(BRAND['font_mono'], 9),
-                         text_color=BRAND['text_muted']).pack(anchor='w')
+            self._main_name_label.configure(text=f"📄  {os.path.basename(main_path)}")
+            self._main_name_label.pack(anchor='w')
+            self._main_path_label.configure(text=f"   {main_path}")
+            self._main_path_label.pack(anchor='w')
 
         if qa_path:
-            ctk.CTkLabel(paths_inner,
-                         text=f"📊  {os.path.basename(qa_path)}",
-                         font=(BRAND['font_mono'], 11),
-                         text_color=BRAND['warning']).pack(anchor='w', pady=(6, 0))
-            ctk.CTkLabel(paths_inner,
-                         text=f"   {qa_path}",
-                         font=(BRAND['font_mono'], 9),
-                         text_color=BRAND['text_muted']).pack(anchor='w')
+            self._qa_name_label.configure(text=f"📊  {os.path.basename(qa_path)}")
+            self._qa_name_label.pack(anchor='w', pady=(6, 0))
+            self._qa_path_label.configure(text=f"   {qa_path}")
+            self._qa_path_label.pack(anchor='w')
 
         if main_path is None:
-            ctk.CTkLabel(paths_inner,
-                         text="⚠  Auto-save failed. Use your file manager to save manually.",
-                         font=(BRAND['font_family'], 11),
-                         text_color=BRAND['warning']).pack(anchor='w')
+            self._save_failed_label.pack(anchor='w')
 
         self._results_panel.pack(fill='x', pady=(12, 0))
 
@@ -857,12 +1362,13 @@ class WescoMROParser(ctk.CTk):
         if not path:
             return
         folder = os.path.dirname(path)
+        # Exec the opener directly — no shell, so quotes in paths are harmless
         if sys.platform == 'darwin':
-            os.system(f'open "{folder}"')
+            subprocess.Popen(['open', folder], start_new_session=True)
         elif sys.platform == 'win32':
             os.startfile(folder)
         else:
-            os.system(f'xdg-open "{folder}"')
+            subprocess.Popen(['xdg-open', folder], start_new_session=True)
 
     def _reset(self):
         """Reset to Step 1 so the user can parse another file."""
@@ -874,10 +1380,17 @@ class WescoMROParser(ctk.CTk):
         self.source_col_vars = {}
         self.supplier_col = None
         self._scored_cols = {}
+        self._empty_rows = 0
         self._exported_path = None
+        self._preview_sample_src = None
+        self._preview_sample = None
+        self._last_preview_df = None
+        self._last_selected = None
+        self._col_panel_gen += 1
 
         # Reset dropzone
-        self._dropzone.configure(height=140, border_color=BRAND['border'], border_width=2)
+        self._dropzone.configure(height=140, border_width=2)
+        self._set_dropzone_border(BRAND['border'])
         self._drop_icon.configure(text="📂", font=(BRAND['font_family'], 32),
                                    text_color=BRAND['text_secondary'])
         self._drop_label.configure(
@@ -902,6 +1415,11 @@ class WescoMROParser(ctk.CTk):
 
         self.title("Wesco MRO Parser")
 
+    def _on_close(self):
+        """Shut down the worker pool before tearing down the window."""
+        self._pool.shutdown()
+        self.destroy()
+
 
 # ═══════════════════════════════════════════════════════════════
 #  ENTRY POINT
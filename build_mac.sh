@@ -23,6 +23,9 @@ pyinstaller \
     --add-data "engine:engine" \
     --hidden-import customtkinter \
     --hidden-import openpyxl \
+    --hidden-import python_calamine \
+    --hidden-import orjson \
+    --hidden-import rapidfuzz \
     --collect-all customtkinter \
     app.py
 
@@ -34,6 +34,9 @@ pyinstaller ^
     --hidden-import openpyxl.writer.excel ^
     --hidden-import et_xmlfile ^
     --hidden-import et_xmlfile.xmlfile ^
+    --hidden-import python_calamine ^
+    --hidden-import orjson ^
+    --hidden-import rapidfuzz ^
     --collect-all customtkinter ^
     --collect-all openpyxl ^
     --collect-all et_xmlfile ^
@@ -10,10 +10,25 @@ Maps arbitrary column names from uploaded files to semantic roles using:
 No API calls required — pure offline matching.
 """
 
-import pandas as pd
 import difflib
 import re
-from typing import Optional
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+# Header matching only needs df.columns; pandas is imported where values are read
+if TYPE_CHECKING:
+    import pandas as pd
+
+# rapidfuzz is optional — its C++ Indel ratio bounds difflib's ratio from
+# above, so it can discard hopeless aliases before the pure-Python check
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_fuzz = _rf_process = None
+
+# Fuzzy header match threshold (difflib.SequenceMatcher.ratio)
+_FUZZY_THRESHOLD = 0.85
 
 # ═══════════════════════════════════════════════════════════════
 #  SEMANTIC ROLES
@@ -36,57 +51,70 @@ ROLES = {
 #  DEFAULT KNOWN COLUMN ALIASES (Seed Dictionary)
 # ═══════════════════════════════════════════════════════════════
 
+# Matching is case-insensitive (see _normalize_aliases), so each alias is
+# listed once — add new spellings, not new capitalizations
 DEFAULT_COLUMN_ALIASES = {
     'source_description': [
-        'Material Description', 'MATERIAL DESCRIPTION', 'Description',
-        'DESCRIPTION', 'Item Description', 'ITEM DESCRIPTION',
+        'Material Description', 'Description', 'Item Description',
         'Mtrl Desc', 'LONG_TEXT', 'Long Text', 'Material Desc',
         'Product Description', 'Line Description', 'Short Description',
-        'MATNR_DESC', 'Mat Description', 'DESC', 'Desc',
+        'MATNR_DESC', 'Mat Description', 'DESC',
         'Item Desc', 'Product Desc',
         # v3: compressed short-text format (e.g. Wesco WESCO.xlsx)
-        'Short Text', 'SHORT TEXT', 'Short_Text', 'ShortText',
+        'Short Text', 'Short_Text', 'ShortText',
         # v4: additional short/item text aliases
-        'Short Desc', 'SHORT DESC', 'Item Text', 'ITEM TEXT',
-        'Line Text', 'LINE TEXT', 'Mat Text', 'MAT TEXT',
-        'Material Text', 'MATERIAL TEXT',
+        'Short Desc', 'Item Text', 'Line Text', 'Mat Text', 'Material Text',
     ],
     'source_po_text': [
         'Material PO Text', 'PO Text', 'PO_TEXT', 'Purchase Order Text',
         'PO Description', 'PO Line Text', 'PO ITEM TEXT',
-        'MATERIAL PO TEXT', 'Material PO TEXT',
     ],
     'source_notes': [
-        'Notes', 'NOTES', 'INFORECTXT1', 'INFORECTXT2', 'Comments',
+        'Notes', 'INFORECTXT1', 'INFORECTXT2', 'Comments',
         'Remarks', 'Additional Info', 'INFO REC TXT 1', 'INFO REC TXT 2',
     ],
     'mfg_output': [
-        'MFG', 'Manufacturer', 'MANUFACTURER', 'Mfg', 'Manufacturer 1',
-        'MFR', 'Brand', 'OEM', 'Vendor', 'VENDOR', 'MFGR',
+        'MFG', 'Manufacturer', 'Manufacturer 1',
+        'MFR', 'Brand', 'OEM', 'Vendor', 'MFGR',
         'Manufacturer Name', 'MFG Name',
     ],
     'pn_output': [
-        'PN', 'Part Number', 'PART NUMBER', 'Part Number 1', 'Part No',
-        'Part #', 'PART#', 'Model Number', 'MODEL NUMBER', 'Catalog Number',
+        'PN', 'Part Number', 'Part Number 1', 'Part No',
+        'Part #', 'PART#', 'Model Number', 'Catalog Number',
         'CAT NO', 'MFG Part Number', 'MFR Part Number',
-        'Part No.', 'PART NO', 'Part Num',
+        'Part No.', 'Part Num',
     ],
     'sim_output': [
         'SIM', 'SIM Number', 'SIM #', 'SIM_NUMBER', 'SIM NUM',
     ],
     'item_number': [
-        'Item #', 'ITEM #', 'ITEM#', 'Item Number', 'Catalog #',
-        'Cat #', 'CAT#', 'Stock Number', 'ITEM NUMBER',
+        'Item #', 'ITEM#', 'Item Number', 'Catalog #',
+        'Cat #', 'CAT#', 'Stock Number',
     ],
     # v3: supplier/vendor columns used as MFG fallback for Short Text files
     'source_supplier': [
         'Supplier Name1', 'Supplier Name 1', 'Supplier Name', 'Supplier',
-        'SUPPLIER', 'SUPPLIER NAME', 'SUPPLIER NAME1', 'Vendor Name',
-        'VENDOR NAME', 'Vendor', 'VENDOR',
+        'Vendor Name', 'Vendor',
     ],
 }
 
 
+def _normalize_aliases(aliases) -> frozenset:
+    """Casefolded/stripped alias set — the form every matching pass compares against.
+
+    Entries are interned, as are normalized headers in _map_header_roles, so
+    set hits short-circuit on identity instead of comparing characters.
+    """
+    return frozenset(sys.intern(a.casefold().strip()) for a in aliases)
+
+
+# Normalized once at import; map_columns only re-normalizes training aliases
+_DEFAULT_ALIASES_LOWER = {
+    role: _normalize_aliases(aliases)
+    for role, aliases in DEFAULT_COLUMN_ALIASES.items()
+}
+
+
 # ═══════════════════════════════════════════════════════════════
 #  KEYWORD FALLBACK PATTERNS
 # ═══════════════════════════════════════════════════════════════
@@ -104,11 +132,18 @@ KEYWORD_FALLBACKS = {
 }
 
 
+# One alternation per role, matched against the casefolded header
+_KEYWORD_PATTERNS = {
+    role: re.compile('|'.join(re.escape(k.casefold()) for k in keywords))
+    for role, keywords in KEYWORD_FALLBACKS.items()
+}
+
+
 # ═══════════════════════════════════════════════════════════════
 #  CORE MAPPING FUNCTION
 # ═══════════════════════════════════════════════════════════════
 
-def map_columns(df: pd.DataFrame, training_data: Optional[dict] = None) -> dict:
+def map_columns(df: 'pd.DataFrame', training_data: Optional[dict] = None) -> dict:
     """
     Analyze a DataFrame's column headers and map them to semantic roles.
 
@@ -126,6 +161,47 @@ def map_columns(df: pd.DataFrame, training_data: Optional[dict] = None) -> dict:
         4. Keyword containment match (e.g., column contains "desc" → source_description)
         5. For unmapped required roles, return None
     """
+    # Header passes (steps 1-4) depend only on the column names and the
+    # training aliases, so they are memoized; step 5 still reads the data
+    extra_aliases = ()
+    if training_data and 'column_aliases' in training_data:
+        extra_aliases = tuple(sorted(
+            (role, _normalize_aliases(aliases))
+            for role, aliases in training_data['column_aliases'].items()
+            if role in _DEFAULT_ALIASES_LOWER
+        ))
+    cached = _map_header_roles(tuple(df.columns), extra_aliases)
+    # Copy the lists so callers mutating the result can't poison the cache
+    result = {role: list(v) if isinstance(v, list) else v
+              for role, v in cached.items()}
+
+    # ── Step 5: Content validation for source_description columns ──
+    # Remove columns that are primarily numeric (SAP IDs, material numbers, quantities).
+    # These columns match keyword patterns (e.g. "material" in column name "Material") but
+    # contain numeric data, not parseable text descriptions.
+    validated_desc = []
+    for col in result.get('source_description', []):
+        if col not in df.columns:
+            continue
+        sample = _head_non_null(df[col], 50).astype(str)
+        if len(sample) == 0:
+            validated_desc.append(col)  # Keep empty columns; can't disqualify on no data
+            continue
+        text_ratio = _count_alpha(sample) / len(sample)
+        if text_ratio >= 0.3:  # At least 30% of sampled values contain letters
+            validated_desc.append(col)
+    result['source_description'] = validated_desc
+
+    # ── Convenience: populate single-value 'supplier' from source_supplier list ──
+    if result.get('supplier') is None and result.get('source_supplier'):
+        result['supplier'] = result['source_supplier'][0]
+
+    return result
+
+
+@lru_cache(maxsize=64)
+def _map_header_roles(available_columns: tuple, extra_aliases: tuple) -> dict:
+    """Steps 1-4 of map_columns: match header names to roles (cached)."""
     # Initialize result with empty structure
     result = {
         'source_description': [],
@@ -139,98 +215,132 @@ def map_columns(df: pd.DataFrame, training_data: Optional[dict] = None) -> dict:
         'supplier': None,
     }
 
-    # Get available column names from DataFrame
-    available_columns = list(df.columns)
+    # Merge training data aliases with defaults (normalized: casefolded + stripped)
+    aliases_lower = dict(_DEFAULT_ALIASES_LOWER)
+    for role, aliases in extra_aliases:
+        aliases_lower[role] = aliases_lower[role] | aliases
 
-    # Merge training data aliases with defaults
-    column_aliases = DEFAULT_COLUMN_ALIASES.copy()
-    if training_data and 'column_aliases' in training_data:
-        for role, aliases in training_data['column_aliases'].items():
-            if role in column_aliases:
-                # Extend with training data, avoiding duplicates
-                column_aliases[role] = list(set(column_aliases[role] + aliases))
+    # Normalize each header once instead of once per role per pass; casefold
+    # (not lower) so non-ASCII headers like 'STRASSE'/'Straße' compare equal
+    col_lower_map = {col: sys.intern(col.casefold().strip()) for col in available_columns}
 
-    # Track which columns have been assigned to avoid duplicates
-    assigned_columns = set()
+    # Columns not yet assigned to any role, in header order (duplicate
+    # headers collapse to one entry — a name can only be assigned once)
+    remaining_cols = list(col_lower_map)
 
     # ── Step 1-2: Exact and case-insensitive matching (all roles) ──
+    # An exact match is also a case-insensitive match, so one set lookup
+    # against the normalized aliases covers both
     for role in result.keys():
-        aliases = column_aliases.get(role, [])
-
-        for col in available_columns:
-            if col in assigned_columns:
-                continue
-
-            # Try exact match
-            if col in aliases:
-                _assign_column(result, role, col, assigned_columns)
-                continue
-
-            # Try case-insensitive match
-            col_lower = col.lower().strip()
-            for alias in aliases:
-                if col_lower == alias.lower().strip():
-                    _assign_column(result, role, col, assigned_columns)
-                    break
+        aliases = aliases_lower.get(role, frozenset())
+
+        for col in tuple(remaining_cols):
+            if col_lower_map[col] in aliases:
+                _assign_column(result, role, col, remaining_cols)
+
+    # Later passes can only fill open roles with unassigned columns, so
+    # once either runs out there is nothing left for them to do
 
     # ── Step 3: Fuzzy matching with high threshold (0.85) ──
+    matcher = difflib.SequenceMatcher(None)
     for role in result.keys():
-        aliases = column_aliases.get(role, [])
+        if not remaining_cols:
+            break
+        if not _role_open(result, role):
+            continue
+        aliases = aliases_lower.get(role, frozenset())
+
+        for col in tuple(remaining_cols):
+            col_lower = col_lower_map[col]
+            matcher.set_seq1(col_lower)
+
+            # Try fuzzy match with stricter threshold to avoid false positives.
+            # real_quick_ratio (the 2*min/(a+b) length bound) and quick_ratio
+            # are cheap upper bounds on ratio(), so aliases failing them can
+            # never reach the threshold
+            for alias in _fuzzy_candidates(col_lower, aliases):
+                if alias == col_lower:
+                    # Identical strings score 1.0 — skip the matcher entirely
+                    _assign_column(result, role, col, remaining_cols)
+                    break
+                matcher.set_seq2(alias)
+                if (matcher.real_quick_ratio() < _FUZZY_THRESHOLD
+                        or matcher.quick_ratio() < _FUZZY_THRESHOLD):
+                    continue
+                if matcher.ratio() >= _FUZZY_THRESHOLD:
+                    _assign_column(result, role, col, remaining_cols)
+                    break
 
-        for col in available_columns:
-            if col in assigned_columns:
-                continue
+            if not _role_open(result, role):
+                break
 
-            col_lower = col.lower().strip()
+    # ── Step 4: Keyword containment fallback ──
+    for role, pattern in _KEYWORD_PATTERNS.items():
+        if not remaining_cols:
+            break
+        if not _role_open(result, role):
+            continue
 
-            # Try fuzzy match with stricter threshold to avoid false positives
-            for alias in aliases:
-                ratio = difflib.SequenceMatcher(None, col_lower, alias.lower().strip()).ratio()
-                if ratio >= 0.85:
-                    _assign_column(result, role, col, assigned_columns)
+        for col in tuple(remaining_cols):
+            # Check if any keyword appears in the column name
+            if pattern.search(col_lower_map[col]):
+                _assign_column(result, role, col, remaining_cols)
+                if not _role_open(result, role):
                     break
 
-    # ── Step 4: Keyword containment fallback ──
-    for role, keywords in KEYWORD_FALLBACKS.items():
-        for col in available_columns:
-            if col in assigned_columns:
-                continue
+    return result
 
-            col_lower = col.lower().strip()
 
-            # Check if any keyword appears in the column name
-            for keyword in keywords:
-                if keyword.lower() in col_lower:
-                    _assign_column(result, role, col, assigned_columns)
-                    break
+def _head_non_null(values, n: int):
+    """
+    Same as values.dropna().head(n), without dropna scanning the whole column.
 
-    # ── Step 5: Content validation for source_description columns ──
-    # Remove columns that are primarily numeric (SAP IDs, material numbers, quantities).
-    # These columns match keyword patterns (e.g. "material" in column name "Material") but
-    # contain numeric data, not parseable text descriptions.
-    validated_desc = []
-    for col in result.get('source_description', []):
-        if col not in df.columns:
-            continue
-        sample = df[col].dropna().head(50).astype(str)
-        if len(sample) == 0:
-            validated_desc.append(col)  # Keep empty columns; can't disqualify on no data
-            continue
-        text_ratio = sum(1 for v in sample if any(c.isalpha() for c in str(v))) / len(sample)
-        if text_ratio >= 0.3:  # At least 30% of sampled values contain letters
-            validated_desc.append(col)
-    result['source_description'] = validated_desc
+    Checks a short leading window first and only falls back to the full
+    scan when that window holds fewer than n non-null values.
+    """
+    limit = max(4 * n, 256)
+    window = values.iloc[:limit].dropna()
+    if len(window) >= n or len(values) <= limit:
+        return window.head(n)
+    return values.dropna().head(n)
 
-    # ── Convenience: populate single-value 'supplier' from source_supplier list ──
-    if result.get('supplier') is None and result.get('source_supplier'):
-        result['supplier'] = result['source_supplier'][0]
 
-    return result
+def _count_alpha(values) -> int:
+    """Number of values whose text contains at least one letter."""
+    # map() runs the per-character isalpha test in C instead of a generator
+    return sum(1 for v in values if any(map(str.isalpha, str(v))))
+
+
+def _fuzzy_candidates(col_lower: str, aliases) -> list:
+    """
+    Aliases that could reach _FUZZY_THRESHOLD against col_lower.
+
+    difflib's ratio counts Ratcliff/Obershelp matching blocks, which never
+    exceed the longest common subsequence that rapidfuzz's ratio is built
+    on — so anything rapidfuzz scores below the cutoff cannot pass difflib
+    either. The final decision is still difflib's, keeping matches identical.
+    Without rapidfuzz every alias is a candidate.
+    """
+    if _rf_process is None:
+        return aliases
+    # Small epsilon so float rounding never drops a pair sitting exactly on the threshold
+    cutoff = _FUZZY_THRESHOLD * 100 - 1e-6
+    return [
+        alias for alias, _, _ in _rf_process.extract(
+            col_lower, aliases, scorer=_rf_fuzz.ratio,
+            score_cutoff=cutoff, limit=None,
+        )
+    ]
+
+
+def _role_open(result: dict, role: str) -> bool:
+    """True if the role can still take a column (list roles always can)."""
+    return role.startswith('source_') or result[role] is None
 
 
-def _assign_column(result: dict, role: str, col_name: str, assigned_set: set):
+def _assign_column(result: dict, role: str, col_name: str, remaining_cols: list):
     """
-    Helper to assign a column to a role and track it in assigned_set.
+    Helper to assign a column to a role and drop it from remaining_cols.
 
     For list roles (source_*), append to the list.
     For single roles (output_*, item_number), set as single value.
@@ -239,12 +349,12 @@ def _assign_column(result: dict, role: str, col_name: str, assigned_set: set):
         # Source columns can have multiple values
         if col_name not in result[role]:
             result[role].append(col_name)
-            assigned_set.add(col_name)
+            remaining_cols.remove(col_name)
     else:
         # Output columns are single value - only assign if not already set
         if result[role] is None:
             result[role] = col_name
-            assigned_set.add(col_name)
+            remaining_cols.remove(col_name)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -282,7 +392,7 @@ def validate_mapping(mapping: dict, strict: bool = False) -> tuple[bool, list[st
     return (len(issues) == 0, issues)
 
 
-def suggest_columns(df: pd.DataFrame, mapping: Optional[dict] = None) -> dict:
+def suggest_columns(df: 'pd.DataFrame', mapping: Optional[dict] = None) -> dict:
     """
     Analyze DataFrame columns and return UI-ready suggestions for the column selector.
 
@@ -325,10 +435,10 @@ def suggest_columns(df: pd.DataFrame, mapping: Optional[dict] = None) -> dict:
         letter = chr(ord('A') + idx) if idx < 26 else f"Col{idx + 1}"
 
         # Content-based confidence scoring
-        sample = df[col].dropna().head(20).astype(str)
+        sample = _head_non_null(df[col], 20).astype(str)
         if len(sample) > 0:
             avg_len = sample.str.len().mean()
-            text_pct = sum(1 for v in sample if any(c.isalpha() for c in v)) / len(sample)
+            text_pct = _count_alpha(sample) / len(sample)
         else:
             avg_len = 0.0
             text_pct = 0.0
@@ -429,13 +539,16 @@ def score_column_for_parsing(col_name: str, sample_values: list) -> float:
 
     # Content scoring — only applied when column is not explicitly excluded
     if not excluded:
+        # Missing cells (None, NaN, NaT, pd.NA) are recognized by their text
+        # form, which keeps pandas out of this module at runtime
         samples = [
-            str(v) for v in sample_values[:20]
-            if pd.notna(v) and str(v).strip() not in ('', 'nan', 'None')
+            s for s in map(str, sample_values[:20])
+            if s.strip() not in ('', 'nan', 'None', 'NaT', '<NA>')
         ]
         if samples:
             avg_len = sum(len(s) for s in samples) / len(samples)
-            text_pct = sum(1 for s in samples if any(c.isalpha() for c in s)) / len(samples)
+            has_alpha = [any(map(str.isalpha, s)) for s in samples]
+            text_pct = sum(has_alpha) / len(samples)
 
             if avg_len > 15:
                 score += 20
@@ -444,8 +557,8 @@ def score_column_for_parsing(col_name: str, sample_values: list) -> float:
 
             # Mixed alphanumeric (typical of MRO descriptions and part numbers)
             mixed_count = sum(
-                1 for s in samples
-                if any(c.isalpha() for c in s) and any(c.isdigit() for c in s)
+                1 for s, alpha in zip(samples, has_alpha)
+                if alpha and any(map(str.isdigit, s))
             )
             if mixed_count / len(samples) > 0.3:
                 score += 10
@@ -453,11 +566,32 @@ def score_column_for_parsing(col_name: str, sample_values: list) -> float:
     return min(score, 100)
 
 
+def score_columns_batch(df: 'pd.DataFrame', sample_rows: int = 20) -> dict:
+    """
+    Score every column of df with score_column_for_parsing in one pass.
+
+    Only the leading sample_rows rows are read (the scorer never looks past
+    20 values), materialized once as an object array rather than as one
+    Python list per column.
+    """
+    head = df.head(sample_rows).to_numpy(dtype=object)
+    return {
+        col: score_column_for_parsing(col, head[:, i].tolist())
+        for i, col in enumerate(df.columns)
+    }
+
+
 def detect_supplier_column(columns: list) -> str | None:
     """
     Return the first column name that looks like a supplier/vendor column.
     Used by the V5 UI to auto-detect the MFG fallback column.
     """
+    # Pure function of the header names — monthly exports repeat the same layout
+    return _detect_supplier_column(tuple(columns))
+
+
+@lru_cache(maxsize=64)
+def _detect_supplier_column(columns: tuple) -> str | None:
     supplier_signals = [
         'supplier', 'vendor', 'vendor name', 'supplier name',
         'mfg name', 'manufacturer name',
@@ -7,7 +7,6 @@ archetype that controls extraction strategy selection.
 """
 
 import re
-import hashlib
 import pandas as pd
 from dataclasses import dataclass, field
 from typing import Optional
@@ -27,6 +26,10 @@ _PURE_CATALOG_RE = re.compile(r'^[A-Z0-9\-/\.]+$')
 # Prefix-coded pattern: 2–4 alpha chars followed by alphanumeric string with ≥1 digit
 # Examples: HUBCS120W, SQDHOM123, SIEMK245
 _PREFIX_CODED_RE = re.compile(r'^[A-Z]{2,4}[A-Z0-9]*[0-9][A-Z0-9]*$')
+_FIRST_TOKEN_RE = re.compile(r'[^\s,]*')
+
+# Tokens are runs between commas/whitespace
+_TOKEN_RE = re.compile(r'[^,\s]+')
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -138,8 +141,9 @@ def _is_prefix_coded(text: str) -> bool:
     """
     if not text:
         return False
-    first_token = text.strip().split()[0].split(',')[0].split(' - ')[0]
-    return bool(_PREFIX_CODED_RE.match(first_token)) and len(first_token) > 5
+    # Leading run up to the first whitespace/comma — one match, no split lists
+    first_token = _FIRST_TOKEN_RE.match(text.lstrip()).group()
+    return len(first_token) > 5 and bool(_PREFIX_CODED_RE.match(first_token))
 
 
 def _classify_archetype(
@@ -202,28 +206,33 @@ def profile_file(
             confidence_threshold=threshold,
         )
 
-    sample = df.sample(actual_sample, random_state=42)
-
     # Filter to only existing source columns
     valid_cols = [c for c in source_cols if c in df.columns]
 
+    # Select the source columns before sampling so only they are gathered;
+    # the sampled row positions depend only on len(df), so rows are unchanged
+    sample = df[valid_cols].sample(actual_sample, random_state=42)
+
     counters = {k: 0 for k in [
         'labeled_pn', 'labeled_mfg', 'prefix_coded',
         'explicit_mfg', 'pure_catalog', 'comma_delimited', 'free_text',
     ]}
     total_tokens = 0
 
-    # Sort known_mfgs by length descending to prefer longer matches
-    sorted_mfgs = sorted(known_mfgs, key=len, reverse=True) if known_mfgs else []
+    # Only presence matters here (not which name matched), so no length
+    # ordering is needed; empty names are dropped once rather than per row
+    mfg_names = [m for m in known_mfgs if m] if known_mfgs else []
 
-    for _, row in sample.iterrows():
-        texts = [str(row.get(c, '')) for c in valid_cols]
-        combined = ' | '.join(t for t in texts if str(t).strip())
+    # One object-array conversion instead of boxing every row into a Series
+    sample_values = sample.to_numpy(dtype=object)
+
+    for row_values in sample_values:
+        texts = [str(v) for v in row_values]
+        combined = ' | '.join(t for t in texts if t.strip())
         combined_upper = combined.strip().upper()
 
-        # Count tokens (split on commas and spaces)
-        tokens = [t for t in re.split(r'[,\s]+', combined_upper) if t]
-        total_tokens += len(tokens)
+        # Count tokens (split on commas and spaces) without building the list
+        total_tokens += sum(1 for _ in _TOKEN_RE.finditer(combined_upper))
 
         # Classify in priority order (first match wins)
         if _LABELED_PN_RE.search(combined_upper):
@@ -232,7 +241,7 @@ def profile_file(
             counters['labeled_mfg'] += 1
         elif _is_prefix_coded(combined_upper):
             counters['prefix_coded'] += 1
-        elif sorted_mfgs and any(m and m in combined_upper for m in sorted_mfgs):
+        elif mfg_names and any(m in combined_upper for m in mfg_names):
             counters['explicit_mfg'] += 1
         elif (
             _PURE_CATALOG_RE.match(combined_upper.strip())
@@ -283,34 +292,3 @@ def profile_file(
         strategy_weights=STRATEGY_WEIGHTS[archetype],
         confidence_threshold=confidence_threshold,
     )
-
-
-# ═══════════════════════════════════════════════════════════════
-#  CACHED VARIANT
-# ═══════════════════════════════════════════════════════════════
-
-def _file_hash(df: pd.DataFrame) -> str:
-    """Quick hash of first 100 rows for cache keying."""
-    sample = df.head(100).to_string()
-    return hashlib.md5(sample.encode()).hexdigest()[:12]
-
-
-_profile_cache: dict = {}
-
-
-def profile_file_cached(
-    df: pd.DataFrame,
-    source_cols: list,
-    **kwargs,
-) -> FileProfile:
-    """
-    Profile a file, returning cached result if same file was profiled before.
-
-    Uses a hash of the first 100 rows as the cache key.
-    """
-    key = _file_hash(df)
-    if key in _profile_cache:
-        return _profile_cache[key]
-    profile = profile_file(df, source_cols, **kwargs)
-    _profile_cache[key] = profile
-    return profile
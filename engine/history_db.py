@@ -8,10 +8,21 @@ and build on previous configurations.
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Optional
 
+# orjson is optional — C serializer, falls back to stdlib json
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
 
 DB_NAME = 'wesco_mro_history.db'
 
@@ -23,15 +34,38 @@ def _get_db_path():
     return os.path.join(app_dir, DB_NAME)
 
 
+_db_ready = False
+_db_init_lock = threading.Lock()
+
+
 def _get_conn():
+    """Open a connection, creating the schema on first use."""
+    if not _db_ready:
+        # Saves can run on several worker threads — one of them creates the
+        # schema (and switches to WAL) while the others wait
+        with _db_init_lock:
+            if not _db_ready:
+                init_db()
+    return _connect()
+
+
+def _connect():
     conn = sqlite3.connect(_get_db_path())
     conn.row_factory = sqlite3.Row
+    # History/config rows are non-critical metadata — with WAL (set once in
+    # init_db), NORMAL sync skips the per-commit fsync stall without risking
+    # corruption. Both of these are per-connection settings.
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
     return conn
 
 
 def init_db():
     """Create tables if they don't exist."""
-    conn = _get_conn()
+    global _db_ready
+    conn = _connect()
+    # journal_mode is stored in the database file, so it only needs setting once
+    conn.execute('PRAGMA journal_mode=WAL')
     conn.execute('''
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -70,6 +104,7 @@ def init_db():
     ''')
     conn.commit()
     conn.close()
+    _db_ready = True
 
 
 @dataclass
@@ -105,7 +140,7 @@ def save_job(filename: str, instruction: str, pipeline: str,
     ''', (
         datetime.now().isoformat(),
         filename, instruction, pipeline,
-        json.dumps(source_columns), target_mfg, target_pn,
+        _dumps(source_columns), target_mfg, target_pn,
         int(add_sim), sim_pattern, total_rows,
         mfg_filled, pn_filled, sim_filled, issues_count, output_path,
     ))
@@ -138,7 +173,7 @@ def save_config(name: str, description: str, instruction: str,
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     ''', (
         name, description, instruction, pipeline,
-        json.dumps(source_columns), target_mfg, target_pn,
+        _dumps(source_columns), target_mfg, target_pn,
         int(add_sim), sim_pattern, datetime.now().isoformat(),
     ))
     conn.commit()
@@ -160,6 +195,3 @@ def delete_config(config_id: int):
     conn.commit()
     conn.close()
 
-
-# Initialize on import
-init_db()
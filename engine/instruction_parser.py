@@ -72,6 +72,22 @@ COLUMN_PATTERNS = {
 COL_LETTER_RE = re.compile(r'(?:column|col\.?)\s*([A-Z])', re.IGNORECASE)
 COL_RANGE_RE = re.compile(r'(?:columns?|cols?\.?)\s*([A-Z])\s*(?:and|&|,|through|to|-)\s*([A-Z])', re.IGNORECASE)
 
+# Precompiled forms of the keyword tables above (patterns are matched against lowercased text)
+_PIPELINE_SIGNAL_RES = {
+    pipeline: [re.compile(p) for p in patterns]
+    for pipeline, patterns in PIPELINE_SIGNALS.items()
+}
+_SOURCE_COL_RES = [
+    re.compile(p)
+    for key in ('material_description', 'material_po_text', 'notes')
+    for p in COLUMN_PATTERNS[key]
+]
+_TARGET_MFG_RES = [re.compile(p) for p in COLUMN_PATTERNS['mfg']]
+_TARGET_PN_RES = [re.compile(p) for p in COLUMN_PATTERNS['pn']]
+INTO_COL_RE = re.compile(r'(?:into|in|to)\s+(?:column|col\.?)\s*([A-Z])', re.IGNORECASE)
+_SIM_WORD_RE = re.compile(r'\bsim\b')
+_SIM_ALSO_RE = re.compile(r'(?:and|with|plus|also|include)\s+sim\b')
+
 SIM_PATTERN_MAP = {
     'dash': ['dash', 'hyphen', 'pattern a', 'pattern-a'],
     'compact': ['compact', 'no separator', 'no space', 'pattern b', 'pattern-b'],
@@ -106,8 +122,8 @@ def parse_instruction(text: str, available_columns: list[str] = None,
 
     # ── 1) Detect pipeline type ──
     scores = {}
-    for pipeline, patterns in PIPELINE_SIGNALS.items():
-        score = sum(1 for p in patterns if re.search(p, t_lower))
+    for pipeline, patterns in _PIPELINE_SIGNAL_RES.items():
+        score = sum(1 for p in patterns if p.search(t_lower))
         scores[pipeline] = score
 
     best_pipeline = max(scores, key=scores.get) if max(scores.values()) > 0 else 'auto'
@@ -117,10 +133,7 @@ def parse_instruction(text: str, available_columns: list[str] = None,
     base_confidence = min(max(scores.values()) / 3.0, 1.0)
 
     # Boost confidence if we detect source column references (description, PO text, etc.)
-    source_col_patterns = COLUMN_PATTERNS.get('material_description', []) + \
-                         COLUMN_PATTERNS.get('material_po_text', []) + \
-                         COLUMN_PATTERNS.get('notes', [])
-    source_col_matches = sum(1 for p in source_col_patterns if re.search(p, t_lower))
+    source_col_matches = sum(1 for p in _SOURCE_COL_RES if p.search(t_lower))
 
     if source_col_matches > 0:
         # Boost confidence: if we detected both pipeline AND source column, treat as high confidence
@@ -187,20 +200,24 @@ def parse_instruction(text: str, available_columns: list[str] = None,
                            'MATERIAL DESCRIPTION', 'DESCRIPTION', 'Notes',
                            'INFORECTXT1', 'INFORECTXT2']
 
+        # Build the lookup index once instead of re-lowercasing per comparison
+        auto_source_set = set(auto_sources)
+        auto_sources_lower = [s.lower() for s in auto_sources]
+
         for col in available_columns:
             if column_mapping:
                 # If we have a mapping, use the mapped columns directly
-                if col in auto_sources:
+                if col in auto_source_set:
                     result.source_columns.append(col)
             else:
                 # Otherwise, use fuzzy matching
-                if col.strip() in auto_sources or any(s.lower() in col.lower() for s in auto_sources):
+                col_lower = col.lower()
+                if col.strip() in auto_source_set or any(s in col_lower for s in auto_sources_lower):
                     result.source_columns.append(col)
 
     # ── 3) Detect target columns ──
     # Check for "into column A" / "in column B" patterns
-    into_pattern = re.compile(r'(?:into|in|to)\s+(?:column|col\.?)\s*([A-Z])', re.IGNORECASE)
-    into_matches = into_pattern.findall(t)
+    into_matches = INTO_COL_RE.findall(t)
 
     if len(into_matches) >= 2 and available_columns:
         idx0 = ord(into_matches[0].upper()) - ord('A')
@@ -213,13 +230,13 @@ def parse_instruction(text: str, available_columns: list[str] = None,
         idx0 = ord(into_matches[0].upper()) - ord('A')
         if idx0 < len(available_columns):
             # Guess based on keyword context
-            if any(re.search(p, t_lower) for p in COLUMN_PATTERNS['mfg']):
+            if any(p.search(t_lower) for p in _TARGET_MFG_RES):
                 result.target_mfg_col = available_columns[idx0]
-            elif any(re.search(p, t_lower) for p in COLUMN_PATTERNS['pn']):
+            elif any(p.search(t_lower) for p in _TARGET_PN_RES):
                 result.target_pn_col = available_columns[idx0]
 
     # ── 4) Detect SIM preferences ──
-    if re.search(r'\bsim\b', t_lower) or result.pipeline == 'sim':
+    if _SIM_WORD_RE.search(t_lower) or result.pipeline == 'sim':
         result.add_sim = True
         for pattern_key, keywords in SIM_PATTERN_MAP.items():
             if any(kw in t_lower for kw in keywords):
@@ -227,7 +244,7 @@ def parse_instruction(text: str, available_columns: list[str] = None,
                 break
 
     # Also add SIM if user says "and SIM" or "with SIM"
-    if re.search(r'(?:and|with|plus|also|include)\s+sim\b', t_lower):
+    if _SIM_ALSO_RE.search(t_lower):
         result.add_sim = True
 
     # ── 5) Build explanation ──
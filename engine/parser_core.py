@@ -12,6 +12,7 @@ All processing is deterministic — no API calls required.
 import re
 import pandas as pd
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 import os
 
@@ -1143,6 +1144,27 @@ def build_sim(mfg: Optional[str], pn: Optional[str], pattern: str = 'space') ->
         return f"{m} {p}".strip()
 
 
+# Columns the pipelines write cell-by-cell under their default names
+# (pipeline_mfg_pn, validate_and_clean, pipeline_part_number,
+# pipeline_sim_builder). Callers that shrink dtypes must leave these as plain
+# object — a categorical rejects any value outside its categories.
+PIPELINE_WRITE_COLUMNS = ('MFG', 'PN', 'PN_FLAGS', 'SIM', 'Part Number 1')
+
+
+def _copy_for_write(df: pd.DataFrame, write_cols: list) -> pd.DataFrame:
+    """
+    Shallow-copy df, giving only the columns written cell-by-cell their own buffers.
+
+    Read-only source columns stay shared with the caller's frame instead of
+    being duplicated on every pipeline/validation pass.
+    """
+    out = df.copy(deep=False)
+    for col in write_cols:
+        if col in out.columns:
+            out[col] = out[col].copy()
+    return out
+
+
 # ═══════════════════════════════════════════════════════════════
 #  POST-EXTRACTION VALIDATION (Layer 4)
 # ═══════════════════════════════════════════════════════════════
@@ -1176,7 +1198,7 @@ def validate_and_clean(
         (cleaned_df, corrections) where corrections is a list of dicts describing
         each change made.
     """
-    df = df.copy()
+    df = _copy_for_write(df, [mfg_col, pn_col])
     corrections = []
 
     # Check columns exist
@@ -1337,7 +1359,6 @@ def pipeline_mfg_pn(
         JobResult with df, counts, file_profile, low_confidence_items, confidence_stats
     """
     result = JobResult(total_rows=len(df))
-    df = df.copy()
 
     # If column_mapping provided and source_cols not explicitly set, use mapping
     if column_mapping and not source_cols:
@@ -1347,6 +1368,9 @@ def pipeline_mfg_pn(
         mfg_col = column_mapping.get('mfg_output') or mfg_col
         pn_col = column_mapping.get('pn_output') or pn_col
 
+    # Only the output columns are written in place — share the rest with the caller
+    df = _copy_for_write(df, [mfg_col, pn_col, 'PN_FLAGS'])
+
     if not source_cols:
         source_cols = []
 
@@ -1407,19 +1431,28 @@ def pipeline_mfg_pn(
     pn_confidences = []
 
     # ── Step 3: Per-row multi-strategy extraction ──────────────────────────────
-    for idx, row in df.iterrows():
-        texts = [str(row.get(c, '')) for c in source_cols if c in df.columns]
+    # Stringify the cells the loop reads once, column by column, instead of
+    # boxing every row into a Series via iterrows() (which also snapshots the
+    # values up front, so reading the precomputed strings is equivalent)
+    def _str_cells(col):
+        return [str(v) for v in df[col].to_numpy(dtype=object)]
+
+    present_src = [c for c in source_cols if c in df.columns]
+    src_strs = {c: _str_cells(c) for c in dict.fromkeys(present_src)}
+    has_supplier = bool(supplier_col) and supplier_col in df.columns
+    sup_strs = _str_cells(supplier_col) if has_supplier else None
+    mfg_strs = _str_cells(mfg_col)
+    pn_strs = _str_cells(pn_col)
+
+    for pos, idx in enumerate(df.index):
+        texts = [src_strs[c][pos] for c in present_src]
         combined_text = ' | '.join(t for t in texts if t.strip())
 
         # P2: Skip non-product rows only when there is no supplier fallback available.
         # Rows with a non-blank supplier are still processed so supplier_fallback
         # can record the correct MFG (e.g. shipping row with supplier=ULINE → MFG=ULINE).
         if is_non_product_row(texts):
-            supplier_val = (
-                str(row.get(supplier_col, '')).strip()
-                if supplier_col and supplier_col in df.columns
-                else ''
-            )
+            supplier_val = sup_strs[pos].strip() if has_supplier else ''
             if supplier_val in ('', 'nan', 'None', 'NaN'):
                 continue
 
@@ -1526,8 +1559,8 @@ def pipeline_mfg_pn(
             ))
 
         # Strategy: supplier fallback
-        if supplier_col and supplier_col in df.columns:
-            sup_raw = str(row.get(supplier_col, ''))
+        if has_supplier:
+            sup_raw = sup_strs[pos]
             sup_mfg, sup_conf = _extract_mfg_from_supplier_value(sup_raw)
             if sup_mfg:
                 mfg_candidates.append(ExtractionCandidate(
@@ -1557,7 +1590,7 @@ def pipeline_mfg_pn(
         pn_final = best_pn
 
         # ── Write MFG if blank and confidence passes threshold ──────────────
-        cur_mfg = str(row.get(mfg_col, '')).strip()
+        cur_mfg = mfg_strs[pos].strip()
         if cur_mfg in ('', 'nan', 'None', 'NaN'):
             if mfg_final and best_mfg_conf >= thresh:
                 df.at[idx, mfg_col] = mfg_final
@@ -1571,7 +1604,7 @@ def pipeline_mfg_pn(
                 })
 
         # ── Write PN if blank and confidence passes threshold ───────────────
-        cur_pn = str(row.get(pn_col, '')).strip()
+        cur_pn = pn_strs[pos].strip()
         if cur_pn in ('', 'nan', 'None', 'NaN'):
             if pn_final and best_pn_conf >= thresh:
                 df.at[idx, pn_col] = pn_final
@@ -1579,8 +1612,7 @@ def pipeline_mfg_pn(
                 pn_confidences.append(best_pn_conf)
                 # P3: Flag if extracted PN is not found verbatim in any source column
                 pn_in_source = any(
-                    pn_final.upper() in str(row.get(c, '')).upper()
-                    for c in source_cols if c in df.columns
+                    pn_final.upper() in t.upper() for t in texts
                 )
                 if not pn_in_source:
                     pn_not_in_source_flags.append(idx)
@@ -1676,11 +1708,21 @@ def pipeline_part_number(df: pd.DataFrame, pn_col: str = 'Part Number 1',
         text_cols = [c for c in df.columns if 'DESCRIPTION' in c.upper()] + \
                     [c for c in ['Notes', 'INFORECTXT1', 'INFORECTXT2'] if c in df.columns]
 
+    # Materialize the text cells and their null mask once — object matrix + bool
+    # matrix — instead of boxing every row into a Series via iterrows()
+    text_cols = [c for c in text_cols if c in df.columns]
+    text_values = df[text_cols].to_numpy(dtype=object)
+    text_mask = df[text_cols].notna().to_numpy(dtype=bool)
+    if pn_col in df.columns:
+        pn_values = df[pn_col].to_numpy(dtype=object)
+    else:
+        pn_values = [None] * len(df)
+
     updated = 0
-    for i, row in df.iterrows():
-        cur = row.get(pn_col)
+    for pos, i in enumerate(df.index):
+        cur = pn_values[pos]
         if not is_valid_pn(str(cur) if pd.notna(cur) else ''):
-            blob = ' '.join(str(row.get(c)) for c in text_cols if pd.notna(row.get(c)))
+            blob = ' '.join(str(v) for v in text_values[pos][text_mask[pos]])
             cands = STRUCTURED_PN_RE.findall(blob.upper())
             cands = [t for t in cands if not any(t.startswith(p) for p in INVALID_PN_PREFIXES)]
             cands = [t for t in cands if re.search(r'[A-Z]', t) and re.search(r'[0-9]', t)]
@@ -1814,3 +1856,25 @@ def parse_single_row(
         return mfg, pn
     except Exception:
         return None, None
+
+
+# parse_single_row is pure (no training data or module state), so preview
+# refreshes can reuse earlier answers for the same (text, supplier) pair
+_parse_single_row_cached = lru_cache(maxsize=1024)(parse_single_row)
+
+
+def parse_rows_batch(texts: list, suppliers: Optional[list] = None) -> list:
+    """
+    Parse several preview rows and return a list of (mfg, pn) tuples.
+
+    Each row is still parsed on its own (profiling and manufacturer mining
+    are per-call, so pooling rows into one pipeline run would change the
+    answers). Results are memoized across calls, so re-rendering the same
+    sample after a checkbox toggle only parses rows whose text changed.
+    """
+    if suppliers is None:
+        suppliers = [None] * len(texts)
+    return [
+        _parse_single_row_cached(text, supplier)
+        for text, supplier in zip(texts, suppliers)
+    ]
@@ -23,6 +23,12 @@ from collections import Counter
 # Import column_mapper to help identify columns in training files
 from .column_mapper import map_columns
 
+# orjson is optional — faster training_data.json loads, stdlib json otherwise
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 # ═══════════════════════════════════════════════════════════════
 #  CONFIGURATION
@@ -102,7 +108,7 @@ def ingest_training_files(directory: str, output_path: str = DEFAULT_TRAINING_FI
         training_files.extend(directory_path.glob(pattern))
         training_files.extend(directory_path.glob(f"**/{pattern}"))  # Recursive search
 
-    training_files = list(set(training_files))  # Remove duplicates
+    training_files = list(dict.fromkeys(training_files))  # Remove duplicates, keep discovery order
     print(f"Found {len(training_files)} training files")
 
     # Counters for aggregation
@@ -366,6 +372,9 @@ def load_training_data(path: str = DEFAULT_TRAINING_FILE) -> dict:
         }
 
     try:
+        if _orjson is not None:
+            with open(path, 'rb') as f:
+                return _orjson.loads(f.read())
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -0,0 +1,241 @@
+"""
+test_app_io.py — File reading/writing helpers used by the desktop app.
+
+Usage:
+    python tests/test_app_io.py
+"""
+import sys
+import os
+import subprocess
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import app
+from engine.parser_core import pipeline_mfg_pn, run_qa, PIPELINE_WRITE_COLUMNS
+
+PASS = 0
+FAIL = 0
+
+
+def check(name, condition, detail=""):
+    global PASS, FAIL
+    if condition:
+        PASS += 1
+        print(f"  ✅ {name}")
+    else:
+        FAIL += 1
+        print(f"  ❌ {name} {detail}")
+
+
+TMP = tempfile.mkdtemp(prefix='mro_app_io_')
+
+
+# ═══════════════════════════════════════════════════════════════
+print("=" * 70)
+print("  TEST 1: CSV WITH BLANK / DUPLICATE HEADERS")
+print("=" * 70)
+
+csv_path = os.path.join(TMP, 'dup_headers.csv')
+with open(csv_path, 'w', newline='') as f:
+    f.write('Desc,,Desc,Vendor\n')
+    for i in range(300):
+        f.write(f'SIEMENS CONTACTOR 3RT2015-1BB41 #{i},x,BALL VALVE 1/2IN,GRAINGER\n')
+
+expected_cols = ['Desc', 'Unnamed: 1', 'Desc.1', 'Vendor']
+preview = app._read_input_file(csv_path, nrows=app._PREVIEW_ROWS)
+full = app._read_input_file(csv_path)
+check("full read renames blank/duplicate headers",
+      list(full.columns) == expected_cols, f"got {list(full.columns)}")
+check("preview and full read agree on headers",
+      preview.columns.equals(full.columns),
+      f"{list(preview.columns)} vs {list(full.columns)}")
+check("full read has every row", len(full) == 300, f"got {len(full)}")
+check("CSV is previewed before the full read", app._streams_preview(csv_path))
+check("Excel is previewed only without calamine",
+      app._streams_preview('book.XLSX') == (not app._HAS_CALAMINE))
+
+try:
+    app._optimize_dtypes(full, keep_object=('MFG', 'PN', 'SIM'))
+    result = pipeline_mfg_pn(full, source_cols=['Desc', 'Desc.1'],
+                             supplier_col='Vendor', add_sim=False)
+    check("pipeline parses the full frame", result.total_rows == 300,
+          f"got {result.total_rows}")
+except Exception as e:
+    check("pipeline parses the full frame", False, repr(e))
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 2: DTYPE OPTIMIZATION")
+print("=" * 70)
+
+dup = pd.DataFrame([[7, 'A', 'B', 'x'] for _ in range(10)],
+                   columns=['Qty', 'Desc', 'Desc', 'MFG'])
+try:
+    app._optimize_dtypes(dup, keep_object=('MFG',))
+    check("duplicate labels don't crash", True)
+    check("duplicate-label text columns become categorical",
+          [str(t) for t in dup.dtypes.iloc[1:3]] == ['category', 'category'],
+          f"got {dup.dtypes.tolist()}")
+    check("keep_object column is left alone", str(dup.dtypes.iloc[3]) != 'category')
+    check("integers are downcast", str(dup.dtypes.iloc[0]) == 'int8')
+except Exception as e:
+    check("duplicate labels don't crash", False, repr(e))
+
+# Re-loading an earlier _parsed.csv: its output/flag columns repeat heavily but
+# the pipeline writes new values into them cell by cell
+reparse_path = os.path.join(TMP, 'previous_parsed.csv')
+pd.DataFrame({
+    'Short Text': ['RLY,PROT,PILZ,MN: PNOZ MI1P'] + ['BALL VALVE 1/2IN BRASS'] * 9,
+    'MFG': [None] + ['SIEMENS'] * 9,
+    'PN': [None] + ['3RT2015-1BB41'] * 9,
+    'PN_FLAGS': [None] + ['REVIEWED'] * 9,
+}).to_csv(reparse_path, index=False)
+reparsed = app._optimize_dtypes(app._read_input_file(reparse_path),
+                                keep_object=PIPELINE_WRITE_COLUMNS)
+try:
+    result_again = pipeline_mfg_pn(reparsed, source_cols=['Short Text'], add_sim=False)
+    check("previously parsed file parses again",
+          result_again.df['PN_FLAGS'].iloc[0] == 'NOT_IN_SOURCE',
+          f"got {result_again.df['PN_FLAGS'].tolist()}")
+except Exception as e:
+    check("previously parsed file parses again", False, repr(e))
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 3: BACKGROUND WORKER POOL")
+print("=" * 70)
+
+pool = app._DaemonPool(workers=2, name='test')
+check("submit returns the job's result", pool.submit(pow, 2, 10).result(5) == 1024)
+failing = pool.submit(int, 'not a number')
+check("job exceptions surface on the future",
+      isinstance(failing.exception(5), ValueError))
+pool.shutdown()
+
+# A job still running when the app closes must not keep the process alive
+exit_script = (
+    "import sys, time; sys.path.insert(0, %r); import app\n"
+    "pool = app._DaemonPool(workers=1, name='exit')\n"
+    "pool.submit(time.sleep, 60); time.sleep(0.2); pool.shutdown()\n"
+) % os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+started = time.monotonic()
+subprocess.run([sys.executable, '-c', exit_script], timeout=30)
+check("interpreter exits without waiting for a running job",
+      time.monotonic() - started < 20, f"took {time.monotonic() - started:.1f}s")
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 4: ATOMIC CSV EXPORT")
+print("=" * 70)
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+records = [
+    {'row': 2, 'flag': 'MFG_IS_SUPPLIER', 'note': 'MFG matches supplier', 'MFG': 'GRAINGER'},
+    {'row': 3, 'flag': 'MFG_BLANK', 'note': 'Has "quotes", commas', 'MFG': None},
+    {'row': 4, 'flag': 'MFG_BLANK', 'note': 'line\nbreak', 'MFG': float('nan')},
+    {'row': 5, 'flag': 'EXTRA', 'note': 'Ünïcödé — ok', 'MFG': 'SIEMENS', 'extra': 1.5},
+]
+qa_path = os.path.join(TMP, 'qa.csv')
+ref_path = os.path.join(TMP, 'qa_ref.csv')
+app._write_records_atomic(records, qa_path)
+pd.DataFrame(records).to_csv(ref_path, index=False, encoding='utf-8-sig')
+check("records writer matches DataFrame.to_csv byte for byte",
+      read_bytes(qa_path) == read_bytes(ref_path),
+      f"\n{read_bytes(qa_path)!r}\nvs\n{read_bytes(ref_path)!r}")
+
+# Real QA output, including rows the pipeline left blank
+qa_frame = pd.DataFrame({'Desc': ['SIEMENS CONTACTOR 3RT2015-1BB41',
+                                  'BALL VALVE 1/2IN BRASS', 'RAG, SHOP, WHITE']})
+qa_result = pipeline_mfg_pn(qa_frame, source_cols=['Desc'], add_sim=False)
+qa_records = run_qa(qa_result.df, mfg_col='MFG')
+app._write_records_atomic(qa_records, qa_path)
+pd.DataFrame(qa_records).to_csv(ref_path, index=False, encoding='utf-8-sig')
+check("run_qa records match DataFrame.to_csv byte for byte",
+      len(qa_records) > 0 and read_bytes(qa_path) == read_bytes(ref_path),
+      f"{len(qa_records)} records")
+
+main_path = os.path.join(TMP, 'main.csv')
+app._write_csv_atomic(result.df, main_path)
+result.df.to_csv(ref_path, index=False, encoding='utf-8-sig')
+check("frame writer matches DataFrame.to_csv byte for byte",
+      read_bytes(main_path) == read_bytes(ref_path))
+
+# A write that fails part-way must leave the previous file untouched and no .part
+before = read_bytes(main_path)
+try:
+    with app._atomic_output(main_path) as tmp:
+        with open(tmp, 'w') as f:
+            f.write('half a file')
+        raise RuntimeError('disk full')
+except RuntimeError:
+    pass
+check("failed write keeps the previous file", read_bytes(main_path) == before)
+check("failed write removes the temp file", not os.path.exists(main_path + '.part'))
+
+
+class Unwritable:
+    def __str__(self):
+        raise ValueError('cannot format')
+
+
+fresh_path = os.path.join(TMP, 'never_written.csv')
+try:
+    app._write_records_atomic([{'row': 1}, {'row': Unwritable()}], fresh_path)
+    check("records writer raises on a bad value", False)
+except ValueError:
+    check("failed records write leaves no output file", not os.path.exists(fresh_path))
+    check("failed records write removes the temp file",
+          not os.path.exists(fresh_path + '.part'))
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 5: EMPTY-ROW COUNT")
+print("=" * 70)
+
+nan = float('nan')
+empty_row_frames = {
+    'no rows': pd.DataFrame({'A': [], 'B': []}),
+    'no columns': pd.DataFrame(index=range(3)),
+    'no all-null rows': pd.DataFrame({'A': [1, None, 3], 'B': [None, 'x', 'y']}),
+    'all-null rows': pd.DataFrame({'A': [None, 2, None, None],
+                                   'B': [None, None, nan, 'z']}),
+    'every row null': pd.DataFrame({'A': [None, None], 'B': [nan, nan]}),
+    'mixed dtypes': pd.DataFrame({
+        'int': pd.array([1, None, None, 4], dtype='Int64'),
+        'float': [nan, nan, nan, 1.0],
+        'text': ['a', None, nan, None],
+        'when': pd.to_datetime(['2024-01-01', None, None, None]),
+        'cat': pd.Categorical(['x', None, None, 'y']),
+        'flag': pd.array([True, None, None, False], dtype='boolean'),
+    }),
+    'duplicate labels': pd.DataFrame([[None, None], [1, None], [None, None]],
+                                     columns=['Desc', 'Desc']),
+}
+for label, frame in empty_row_frames.items():
+    expected = int(frame.isna().all(axis=1).sum())
+    got = app._count_empty_rows(frame)
+    check(f"{label}: {got} empty rows", got == expected, f"expected {expected}")
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print(f"  FINAL RESULTS: {PASS} passed, {FAIL} failed")
+print("=" * 70)
+
+if FAIL > 0:
+    print("\n  ⚠️  SOME TESTS FAILED — review and fix before committing")
+    sys.exit(1)
+else:
+    print("\n  \U0001f389 ALL TESTS PASSED")
+    sys.exit(0)
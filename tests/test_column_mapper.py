@@ -0,0 +1,111 @@
+"""
+test_column_mapper.py — Column scoring / mapping checks for the V5 UI helpers.
+
+Usage:
+    python tests/test_column_mapper.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from engine.column_mapper import (
+    score_column_for_parsing, score_columns_batch, detect_supplier_column,
+    map_columns,
+)
+
+PASS = 0
+FAIL = 0
+
+
+def check(name, condition, detail=""):
+    global PASS, FAIL
+    if condition:
+        PASS += 1
+        print(f"  ✅ {name}")
+    else:
+        FAIL += 1
+        print(f"  ❌ {name} {detail}")
+
+
+# ═══════════════════════════════════════════════════════════════
+print("=" * 70)
+print("  TEST 1: BATCH COLUMN SCORING")
+print("=" * 70)
+
+n = 60
+df = pd.DataFrame({
+    'Short Text': ['PANDUIT PLT2S-M0 CABLE TIE 7.4IN'] * n,
+    'Plant': ['1001'] * n,
+    'Qty': np.arange(n),
+    'Unit Price': np.linspace(1.0, 9.0, n),
+    'Unnamed: 4': [np.nan] * 5 + ['SIEMENS 3RT2016-1AP01 CONTACTOR'] * (n - 5),
+    'Material': pd.Categorical(['ABC-123', 'XYZ 9'] * (n // 2)),
+    'Notes': [None] * n,
+})
+
+batch = score_columns_batch(df)
+single = {col: score_column_for_parsing(col, df[col].tolist()) for col in df.columns}
+check("score_columns_batch matches per-column scoring", batch == single,
+      f"got {batch} vs {single}")
+check("score_columns_batch keeps column order", list(batch) == list(df.columns))
+check("score_columns_batch on empty frame scores names only",
+      score_columns_batch(df.head(0)) == {
+          col: score_column_for_parsing(col, []) for col in df.columns
+      })
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 2: SUPPLIER COLUMN DETECTION")
+print("=" * 70)
+
+cols = ['Short Text', 'Plant', 'Supplier Name1', 'Vendor']
+check("detect_supplier_column picks first supplier-like header",
+      detect_supplier_column(cols) == 'Supplier Name1')
+check("detect_supplier_column is stable across repeated calls",
+      detect_supplier_column(list(cols)) == detect_supplier_column(cols))
+check("detect_supplier_column returns None without a match",
+      detect_supplier_column(['Short Text', 'Plant']) is None)
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 3: ALIAS MATCHING")
+print("=" * 70)
+
+hdr_df = pd.DataFrame(columns=['material description ', 'MANUFACTURER', 'Part No.', 'Info Rec Txt 1'])
+m = map_columns(hdr_df)
+check("case/whitespace variants match source_description",
+      m['source_description'] == ['material description '], f"got {m['source_description']}")
+check("upper-case alias matches mfg_output", m['mfg_output'] == 'MANUFACTURER')
+check("exact alias matches pn_output", m['pn_output'] == 'Part No.')
+check("mixed-case alias matches source_notes", m['source_notes'] == ['Info Rec Txt 1'])
+
+trained = map_columns(pd.DataFrame(columns=['Widget Blurb']),
+                      {'column_aliases': {'source_description': ['WIDGET BLURB']}})
+check("training aliases are matched case-insensitively",
+      trained['source_description'] == ['Widget Blurb'], f"got {trained['source_description']}")
+
+# Header passes are memoized — mutating a result must not leak into the next call
+m['source_notes'].append('bogus')
+again = map_columns(hdr_df)
+check("cached mapping is not poisoned by caller mutation",
+      again['source_notes'] == ['Info Rec Txt 1'], f"got {again['source_notes']}")
+untrained = map_columns(pd.DataFrame(columns=['Widget Blurb']))
+check("training aliases are part of the cache key",
+      untrained['source_description'] == [], f"got {untrained['source_description']}")
+
+
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print(f"  FINAL RESULTS: {PASS} passed, {FAIL} failed")
+print("=" * 70)
+
+if FAIL > 0:
+    print("\n  ⚠️  SOME TESTS FAILED — review and fix before committing")
+    sys.exit(1)
+else:
+    print("\n  \U0001f389 ALL TESTS PASSED")
+    sys.exit(0)
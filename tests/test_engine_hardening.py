@@ -317,6 +317,39 @@ else:
     print(f"  \u26a0\ufe0f  Data Set 1 files not found — skipping regression test")
 
 
+# ═══════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 8: PIPELINE LEAVES THE INPUT FRAME UNCHANGED")
+print("=" * 70)
+
+# Source columns are shared with the caller's frame rather than copied, so
+# every write inside the pipeline must land on the pipeline's own columns
+df_in = pd.DataFrame({
+    'Short Text': ['CONTACTOR,3RT2015-1BB41,SIEMENS', 'BEARING,6205-2RS,SKF',
+                   'BALL VALVE 1/2IN NPT BRASS', 'MFG: ALLEN BRADLEY PN: 1756-L71'],
+    'Vendor': ['GRAINGER', 'MOTION', None, 'GRAINGER'],
+    'MFG': ['SIEMENS', None, '', 'SIEMENS'],
+    'PN': [None, 'A', '', 'SIEMENS'],
+    'PN_FLAGS': ['', None, 'old', ''],
+})
+df_before = df_in.copy(deep=True)
+
+try:
+    result = pipeline_mfg_pn(df_in, source_cols=['Short Text'],
+                             supplier_col='Vendor', add_sim=False)
+    check("pipeline produced output", len(result.df) == len(df_in))
+    check("pipeline did not modify input values", df_in.equals(df_before),
+          f"\n{df_in}\nvs\n{df_before}")
+    check("pipeline did not modify input columns/dtypes",
+          list(df_in.columns) == list(df_before.columns)
+          and df_in.dtypes.equals(df_before.dtypes))
+
+    validate_and_clean(df_in)
+    check("validate_and_clean did not modify input", df_in.equals(df_before))
+except Exception as e:
+    check("pipeline leaves input unchanged", False, repr(e))
+
+
 # ═══════════════════════════════════════════════════════════════
 print("\n" + "=" * 70)
 print(f"  FINAL RESULTS: {PASS} passed, {FAIL} failed")
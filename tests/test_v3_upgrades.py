@@ -20,6 +20,8 @@ from engine.parser_core import (
     pipeline_mfg_pn,
     decode_mfg_prefix,
     KNOWN_MANUFACTURERS,
+    parse_single_row,
+    parse_rows_batch,
 )
 
 PASS = 0
@@ -353,6 +355,35 @@ else:
     print(f"    Expected: {ds1_input}")
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+print("\n" + "=" * 70)
+print("  TEST 6: BATCH PREVIEW PARSING (parse_rows_batch)")
+print("=" * 70)
+
+# parse_rows_batch must give exactly what parse_single_row gives row by row,
+# including repeated rows served from its memo and rows with no supplier
+batch_texts = [
+    "CONTACTOR,3RT2015-1BB41,SIEMENS",
+    "BEARING,6205-2RS,SKF",
+    "BALL VALVE 1/2IN NPT BRASS",
+    "CONTACTOR,3RT2015-1BB41,SIEMENS",
+    "",
+    "MFG: ALLEN BRADLEY PN: 1756-L71",
+]
+batch_suppliers = ["GRAINGER", None, "MCMASTER", "GRAINGER", None, None]
+
+for label, suppliers in (("with suppliers", batch_suppliers), ("no suppliers", None)):
+    row_by_row = [
+        parse_single_row(t, s)
+        for t, s in zip(batch_texts, suppliers or [None] * len(batch_texts))
+    ]
+    for _ in range(2):  # second pass is answered from the memo
+        batch = parse_rows_batch(batch_texts, suppliers)
+        check(f"Batch == row-by-row ({label})", repr(batch), repr(row_by_row))
+
+check("Batch of no rows", repr(parse_rows_batch([])), repr([]))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 print("\n" + "=" * 70)
 print(f"  FINAL RESULTS: {PASS} passed, {FAIL} failed")